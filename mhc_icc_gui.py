@@ -1,14 +1,18 @@
+import csv
 import hashlib
 import io
 import re
 import struct
 import tkinter as tk
 import webbrowser
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from tkinter import filedialog, messagebox, ttk
-from typing import Dict, List, Tuple
+from tkinter import filedialog, font as tkfont, messagebox, ttk
+from typing import Callable, Dict, List, Tuple
 
 import numpy as np
 
@@ -129,35 +133,75 @@ def xyY_to_XYZ_custom(xyy: Tuple[float, float, float]) -> Tuple[float, float, fl
     return (X, Y, Z)
 
 
-def XYZ_to_xyY_custom(XYZ: Tuple[float, float, float]) -> Tuple[float, float, float]:
-    X, Y, Z = XYZ
-    total = X + Y + Z
-    if total == 0:
-        return (0.0, 0.0, 0.0)
-    x = X / total
-    y = Y / total
-    return (x, y, Y)
+# Row-wise (N, 3) xyY <-> XYZ conversions; rows whose denominator is zero come out all zero,
+# as in xyY_to_XYZ_custom
+def xyY_to_XYZ_array(xyy) -> np.ndarray:
+    xyy = np.asarray(xyy, dtype=np.float64)
+    x, y, Y = xyy[:, 0], xyy[:, 1], xyy[:, 2]
+    valid = y != 0
+    X = np.divide(x * Y, y, out=np.zeros_like(y), where=valid)
+    Z = np.divide((1 - x - y) * Y, y, out=np.zeros_like(y), where=valid)
+    return np.stack([X, np.where(valid, Y, 0.0), Z], axis=1)
+
+
+def XYZ_to_xyY_array(xyz) -> np.ndarray:
+    xyz = np.asarray(xyz, dtype=np.float64)
+    total = xyz.sum(axis=1)
+    valid = total != 0
+    x = np.divide(xyz[:, 0], total, out=np.zeros_like(total), where=valid)
+    y = np.divide(xyz[:, 1], total, out=np.zeros_like(total), where=valid)
+    return np.stack([x, y, np.where(valid, xyz[:, 1], 0.0)], axis=1)
+
+
+# Quick-fill presets offered in the XYZ workspace (wtpt gets illuminants, primaries get RGB spaces)
+_QUICK_FILL_ILLUMINANTS: List[str] = ["D50", "D55", "D60", "D65", "D75"]
+_QUICK_FILL_SPACES: Dict[str, str] = {
+    "sRGB": "sRGB",
+    "BT.709": "ITU-R BT.709",
+    "Adobe RGB": "Adobe RGB (1998)",
+    "Display P3": "P3-D65",
+    "DCI-P3": "DCI-P3",
+    "BT.2020": "ITU-R BT.2020",
+}
+_QUICK_FILL_SPACE_NAMES: List[str] = list(_QUICK_FILL_SPACES)
+
+
+# Primary XYZ columns and whitepoint XYZ per RGB space, resolved once at import
+_RGB_PRIMARIES: Dict[str, Tuple[Tuple[float, float, float], ...]] = {
+    name: tuple(tuple(float(row[col]) for row in data["matrix"]) for col in range(3))
+    for name, data in RGB_SPACE_DATA.items()
+}
+_RGB_WHITE_XYZ: Dict[str, Tuple[float, float, float]] = {
+    name: xy_to_XYZ_custom(data["white_xy"] if "white_xy" in data else ILLUMINANTS.get(data["white"], (0.31270, 0.32900)))
+    for name, data in RGB_SPACE_DATA.items()
+}
+_PRIMARY_COLUMN: Dict[str, int] = {"r": 0, "g": 1}
 
 
 def rgb_primary_from_matrix(space: str, primary: str) -> Tuple[float, float, float]:
-    data = RGB_SPACE_DATA[space]
-    mat = np.asarray(data["matrix"], dtype=float)
-    if primary == "r":
-        vec = mat[:, 0]
-    elif primary == "g":
-        vec = mat[:, 1]
-    else:
-        vec = mat[:, 2]
-    return tuple(float(v) for v in vec)
+    return _RGB_PRIMARIES[space][_PRIMARY_COLUMN.get(primary, 2)]
 
 
 def rgb_whitepoint_xyz(space: str) -> Tuple[float, float, float]:
-    data = RGB_SPACE_DATA[space]
-    if "white_xy" in data:
-        xy = data["white_xy"]
+    return _RGB_WHITE_XYZ[space]
+
+
+# XYZ a quick-fill preset puts into the given XYZ tag; wtpt is normalized to Y=1, while
+# primaries keep their luminance coefficients as-is
+@lru_cache(maxsize=64)
+def xyz_quick_fill(sig: str, choice: str) -> Tuple[float, float, float]:
+    if choice in _QUICK_FILL_ILLUMINANTS:
+        X, Y, Z = xy_to_XYZ_custom(ILLUMINANTS[choice])
     else:
-        xy = ILLUMINANTS.get(data["white"], (0.31270, 0.32900))
-    return xy_to_XYZ_custom(xy)
+        cs_key = _QUICK_FILL_SPACES[choice]
+        if sig in {"rXYZ", "gXYZ", "bXYZ"}:
+            X, Y, Z = rgb_primary_from_matrix(cs_key, sig[0])
+        else:
+            X, Y, Z = rgb_whitepoint_xyz(cs_key)
+    if sig == "wtpt" and Y != 0:
+        factor = 1.0 / Y
+        return (X * factor, Y * factor, Z * factor)
+    return (X, Y, Z)
 
 
 PCS_CHOICES: Dict[str, str] = {
@@ -179,49 +223,121 @@ RENDERING_INTENTS: Dict[int, str] = {
     2: "Saturation",
     3: "ICC-absolute colorimetric",
 }
+_INTENT_BY_NAME: Dict[str, int] = {v.lower(): k for k, v in RENDERING_INTENTS.items()}
+
+# Rendered "sig - desc" combobox values for the choice fields below
+DEVICE_CLASSES_VALUES: List[str] = [f"{sig} - {desc}" for sig, desc in DEVICE_CLASSES.items()]
+COLOR_SPACES_VALUES: List[str] = [f"{sig} - {desc}" for sig, desc in COLOR_SPACES.items()]
+PCS_CHOICES_VALUES: List[str] = [f"{sig} - {desc}" for sig, desc in PCS_CHOICES.items()]
+PLATFORM_CHOICES_VALUES: List[str] = [f"{sig} - {desc}" for sig, desc in PLATFORM_CHOICES.items()]
+
+
+# One 128-byte header field: its byte length, editor kind and default bytes
+@dataclass(frozen=True, slots=True)
+class HeaderField:
+    key: str
+    label: str
+    length: int
+    type: str
+    default_hex: str
+    choices: Dict[str, str] | None = None
+    choices_values: List[str] | None = None
+    hidden: bool = False
+
 
 # Header defaults pulled from the sample BASE profile
-HEADER_FIELDS: List[Dict[str, object]] = [
-    {"key": "size", "label": "Profile size (bytes)", "length": 4, "type": "size", "default_hex": "0000032C"},
-    {"key": "cmm_type", "label": "CMM type", "length": 4, "type": "sig", "default_hex": "53494343"},
-    {"key": "version", "label": "ICC version", "length": 4, "type": "version", "default_hex": "04400000"},
-    {"key": "device_class", "label": "Device class", "length": 4, "type": "choice", "choices": DEVICE_CLASSES, "default_hex": "6D6E7472"},
-    {"key": "color_space", "label": "Color space", "length": 4, "type": "choice", "choices": COLOR_SPACES, "default_hex": "52474220"},
-    {"key": "pcs", "label": "PCS", "length": 4, "type": "choice", "choices": PCS_CHOICES, "default_hex": "58595A20"},
-    {"key": "date_time", "label": "Creation date", "length": 12, "type": "datetime-fixed", "default_hex": "07E9000C00040010002F0010"},
-    {"key": "acsp", "label": "acsp signature", "length": 4, "type": "sig-fixed", "default_hex": "61637370"},
-    {"key": "platform", "label": "Platform", "length": 4, "type": "choice", "choices": PLATFORM_CHOICES, "default_hex": "4D534654"},
-    {"key": "flags", "label": "Flags", "length": 4, "type": "flags", "default_hex": "00000000"},
-    {"key": "manufacturer", "label": "Manufacturer", "length": 4, "type": "sig-limited", "default_hex": "00000000"},
-    {"key": "model", "label": "Model", "length": 4, "type": "sig-limited", "default_hex": "00000000"},
-    {"key": "attributes", "label": "Device attributes", "length": 8, "type": "attributes", "default_hex": "0000000000000001"},
-    {"key": "rendering_intent", "label": "Rendering intent", "length": 4, "type": "intent", "default_hex": "00000001"},
-    {"key": "illuminant", "label": "Illuminant (XYZ)", "length": 12, "type": "illuminant", "default_hex": "0000F6D6000100000000D32D"},
-    {"key": "creator", "label": "Profile creator", "length": 4, "type": "sig-limited", "default_hex": "4D534654"},
-    {"key": "profile_id", "label": "Profile ID", "length": 16, "type": "profile_id", "default_hex": "00" * 16},
-    {"key": "reserved", "label": "Reserved", "length": 28, "type": "hex", "default_hex": "00" * 28, "hidden": True},
+HEADER_FIELDS: List[HeaderField] = [
+    HeaderField(key="size", label="Profile size (bytes)", length=4, type="size", default_hex="0000032C"),
+    HeaderField(key="cmm_type", label="CMM type", length=4, type="sig", default_hex="53494343"),
+    HeaderField(key="version", label="ICC version", length=4, type="version", default_hex="04400000"),
+    HeaderField(key="device_class", label="Device class", length=4, type="choice", choices=DEVICE_CLASSES, choices_values=DEVICE_CLASSES_VALUES, default_hex="6D6E7472"),
+    HeaderField(key="color_space", label="Color space", length=4, type="choice", choices=COLOR_SPACES, choices_values=COLOR_SPACES_VALUES, default_hex="52474220"),
+    HeaderField(key="pcs", label="PCS", length=4, type="choice", choices=PCS_CHOICES, choices_values=PCS_CHOICES_VALUES, default_hex="58595A20"),
+    HeaderField(key="date_time", label="Creation date", length=12, type="datetime-fixed", default_hex="07E9000C00040010002F0010"),
+    HeaderField(key="acsp", label="acsp signature", length=4, type="sig-fixed", default_hex="61637370"),
+    HeaderField(key="platform", label="Platform", length=4, type="choice", choices=PLATFORM_CHOICES, choices_values=PLATFORM_CHOICES_VALUES, default_hex="4D534654"),
+    HeaderField(key="flags", label="Flags", length=4, type="flags", default_hex="00000000"),
+    HeaderField(key="manufacturer", label="Manufacturer", length=4, type="sig-limited", default_hex="00000000"),
+    HeaderField(key="model", label="Model", length=4, type="sig-limited", default_hex="00000000"),
+    HeaderField(key="attributes", label="Device attributes", length=8, type="attributes", default_hex="0000000000000001"),
+    HeaderField(key="rendering_intent", label="Rendering intent", length=4, type="intent", default_hex="00000001"),
+    HeaderField(key="illuminant", label="Illuminant (XYZ)", length=12, type="illuminant", default_hex="0000F6D6000100000000D32D"),
+    HeaderField(key="creator", label="Profile creator", length=4, type="sig-limited", default_hex="4D534654"),
+    HeaderField(key="profile_id", label="Profile ID", length=16, type="profile_id", default_hex="00" * 16),
+    HeaderField(key="reserved", label="Reserved", length=28, type="hex", default_hex="00" * 28, hidden=True),
 ]
+_HEADER_VISIBLE: List[HeaderField] = [f for f in HEADER_FIELDS if not f.hidden]
+
+
+def _header_layout() -> Tuple[List[Tuple[str, int, int, bool]], int]:
+    layout = []
+    offset = 0
+    for f in HEADER_FIELDS:
+        layout.append((f.key, offset, f.length, f.type == "hex"))
+        offset += f.length
+    return layout, offset
+
+
+# (key, byte offset, length, needs hex cleaning) write sites for the 128-byte header
+_HEADER_LAYOUT, _HEADER_LENGTH = _header_layout()
+
+
+_HEX_STRIP_RE = re.compile(r"[^0-9A-Fa-f]")
+_VERSION_RE = re.compile(r"^(\d+)(?:\.(\d)(\d)?)?$")
+_XYZ_SPLIT_RE = re.compile(r"[ ,]+")
+_INTENT_RE = re.compile(r"\s*(\d+)")
+_HEX_PAIR_RE = re.compile(r"[0-9A-Fa-f]{2}")
+# Anything that can still become a decimal number while it is being typed ("", "-", "1.", "2e-");
+# surrounding whitespace is allowed since float() ignores it
+_PARTIAL_NUMBER_RE = re.compile(r"\s*[+-]?\d*\.?\d*(?:[eE][+-]?\d*)?\s*")
+_DATETIME_RE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})\s+(\d{1,2}):(\d{1,2}):(\d{1,2})$")
+_DATETIME_STRUCT = struct.Struct(">6H")
+_XYZ_STRUCT = struct.Struct(">iii")
+_XYZ_TAG_STRUCT = struct.Struct(">4s4xiii")
+_VER_STRUCT = struct.Struct(">BBBB")
+_TAG_RECORD_STRUCT = struct.Struct(">4sII")
+_U32_STRUCT = struct.Struct(">I")
+# Tag-type layouts: type signature and reserved word, then the type's fixed fields
+_CURV_HEADER_STRUCT = struct.Struct(">4s4xI")
+_MHC2_HEADER_STRUCT = struct.Struct(">4s4xIiiIIII")
+_MLUC_HEADER_STRUCT = struct.Struct(">4s4xII")
+_MLUC_RECORD_STRUCT = struct.Struct(">2s2sII")
+
+
+# Single-pass strip (and uppercase, for canonical_hex) for Latin-1 input; anything beyond that
+# falls back to the regex
+_NON_HEX_LATIN1 = "".join(chr(c) for c in range(256) if chr(c) not in "0123456789abcdefABCDEF")
+_HEX_KEEP_TABLE = str.maketrans("", "", _NON_HEX_LATIN1)
+_HEX_CANON = str.maketrans("abcdef", "ABCDEF", _NON_HEX_LATIN1)
 
 
 def clean_hex(value: str) -> str:
-    return re.sub(r"[^0-9A-Fa-f]", "", value or "")
+    out = (value or "").translate(_HEX_KEEP_TABLE)
+    if not out.isascii():
+        return _HEX_STRIP_RE.sub("", out)
+    return out
+
+
+def canonical_hex(value: str) -> str:
+    out = (value or "").translate(_HEX_CANON)
+    if not out.isascii():
+        return _HEX_STRIP_RE.sub("", out)
+    return out
 
 
 def int_to_hex(value: int, length_bytes: int) -> str:
-    max_val = 256 ** length_bytes - 1
-    if value < 0 or value > max_val:
+    if value < 0 or value.bit_length() > length_bytes * 8:
         raise ValueError(f"Value {value} does not fit in {length_bytes} bytes.")
     return f"{value:0{length_bytes * 2}X}"
 
 
+@lru_cache(maxsize=512)
 def hex_to_sig(hex_str: str) -> str:
     bytes_val = bytes.fromhex(hex_str[:8])
-    try:
-        return bytes_val.decode("ascii")
-    except Exception:
-        return bytes_val.hex().upper()
+    return bytes_val.decode("ascii") if bytes_val.isascii() else bytes_val.hex().upper()
 
 
+@lru_cache(maxsize=512)
 def sig_to_hex(sig: str) -> str:
     if len(sig) != 4:
         raise ValueError("Signature must be exactly 4 characters.")
@@ -233,26 +349,28 @@ def sig_to_hex(sig: str) -> str:
 
 
 def hex_to_version(hex_str: str) -> str:
-    value = int(hex_str, 16)
-    major = (value >> 24) & 0xFF
-    minor = (value >> 20) & 0x0F
-    bugfix = (value >> 16) & 0x0F
+    major, minor_bugfix, _, _ = _VER_STRUCT.unpack(bytes.fromhex(hex_str[:8]))
+    minor = (minor_bugfix >> 4) & 0x0F
+    bugfix = minor_bugfix & 0x0F
     return f"{major}.{minor}{bugfix if bugfix else ''}"
 
 
 def version_to_hex(text: str) -> str:
-    m = re.match(r"^(\d+)(?:\.(\d)(\d)?)?$", text.strip())
+    m = _VERSION_RE.match(text.strip())
     if not m:
         raise ValueError("Version must be like 4.4 or 4.31")
     major = int(m.group(1))
     minor = int(m.group(2) or 0)
     bugfix = int(m.group(3) or 0)
-    value = (major << 24) | (minor << 20) | (bugfix << 16)
-    return int_to_hex(value, 4)
+    if major > 0xFF:
+        raise ValueError(f"Value {major << 24} does not fit in 4 bytes.")
+    return _VER_STRUCT.pack(major, (minor << 4) | bugfix, 0, 0).hex().upper()
 
 
 def hex_to_datetime_text(hex_str: str) -> str:
-    parts = [int(hex_str[i : i + 4], 16) for i in range(0, 24, 4)]
+    if len(hex_str) < 24:
+        raise ValueError("Date needs 12 bytes")
+    parts = _DATETIME_STRUCT.unpack(bytes.fromhex(hex_str[:24]))
     try:
         dt = datetime(*parts)
         return dt.strftime("%Y-%m-%d %H:%M:%S")
@@ -261,12 +379,15 @@ def hex_to_datetime_text(hex_str: str) -> str:
 
 
 def datetime_text_to_hex(text: str) -> str:
+    m = _DATETIME_RE.match(text.strip())
+    if not m:
+        raise ValueError("Date must be YYYY-MM-DD HH:MM:SS")
+    parts = [int(g) for g in m.groups()]
     try:
-        dt = datetime.strptime(text.strip(), "%Y-%m-%d %H:%M:%S")
-    except Exception:
+        datetime(*parts)  # range check only (month 1-12, valid day, ...)
+    except ValueError:
         raise ValueError("Date must be YYYY-MM-DD HH:MM:SS")
-    parts = [dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second]
-    return "".join(int_to_hex(p, 2) for p in parts)
+    return _DATETIME_STRUCT.pack(*parts).hex().upper()
 
 
 def to_s15fixed16(value: float) -> int:
@@ -274,187 +395,353 @@ def to_s15fixed16(value: float) -> int:
 
 
 def from_s15fixed16(raw: int) -> float:
-    if raw & 0x80000000:
-        raw = -((~raw + 1) & 0xFFFFFFFF)
+    # raw comes from a signed ">i" unpack, so no sign fix-up is needed
     return raw / 65536.0
 
 
-def hex_to_xyz_text(hex_str: str) -> str:
+def s15fixed16_bytes_to_float(buf: bytes) -> np.ndarray:
+    return np.frombuffer(buf, dtype=">i4").astype(np.float64) / 65536.0
+
+
+def float_to_s15fixed16_bytes(values) -> bytes:
+    fixed = np.rint(np.asarray(values, dtype=np.float64) * 65536.0)
+    if fixed.size and not (np.isfinite(fixed).all() and fixed.min() >= -0x80000000 and fixed.max() <= 0x7FFFFFFF):
+        raise ValueError("Value out of range for s15Fixed16")
+    return fixed.astype(">i4").tobytes()
+
+
+def hex_to_xyz_components(hex_str: str) -> Tuple[float, float, float]:
     if len(hex_str) < 24:
         raise ValueError("XYZ needs 12 bytes")
-    x_raw, y_raw, z_raw = struct.unpack(">iii", bytes.fromhex(hex_str[:24]))
-    vals = [from_s15fixed16(v) for v in (x_raw, y_raw, z_raw)]
-    return ",".join(f"{v:.5f}" for v in vals)
+    x_raw, y_raw, z_raw = _XYZ_STRUCT.unpack(bytes.fromhex(hex_str[:24]))
+    return (x_raw / 65536.0, y_raw / 65536.0, z_raw / 65536.0)
+
+
+def xyz_components_to_hex(x: float, y: float, z: float) -> str:
+    return _XYZ_STRUCT.pack(round(x * 65536), round(y * 65536), round(z * 65536)).hex().upper()
+
+
+def hex_to_xyz_text(hex_str: str) -> str:
+    return ",".join(f"{v:.5f}" for v in hex_to_xyz_components(hex_str))
 
 
 def xyz_text_to_hex(text: str) -> str:
-    parts = re.split(r"[ ,]+", text.strip())
+    parts = _XYZ_SPLIT_RE.split(text.strip())
     if len(parts) != 3:
         raise ValueError("XYZ needs three values like 0.9642,1.0000,0.8249")
-    vals = [float(p) for p in parts]
-    fixed = [to_s15fixed16(v) for v in vals]
-    return struct.pack(">iii", *fixed).hex().upper()
-
-
-def human_to_hex(field: Dict[str, object], text: str) -> str:
-    t = field["type"]
-    length = field["length"]
-    if t == "u32":
-        return int_to_hex(int(text), length)
-    if t == "u64":
-        return int_to_hex(int(text), length)
-    if t == "hex":
-        cleaned = clean_hex(text).upper()
-        return cleaned.zfill(length * 2)[: length * 2]
-    if t in {"sig", "sig-fixed"}:
-        return sig_to_hex(text.strip().ljust(4)[:4])
-    if t == "sig-limited":
-        cleaned = text.rstrip()
-        if len(cleaned) > 4:
-            raise ValueError("Field must be 4 characters or fewer.")
-        if not cleaned:
-            return "00000000"
-        padded = cleaned.ljust(4)
-        return sig_to_hex(padded)
-    if t == "choice":
-        if text.startswith("0000"):
-            return "00000000"
-        sig = text[:4]
-        return sig_to_hex(sig)
-    if t == "version":
-        return version_to_hex(text)
-    if t == "datetime":
-        return datetime_text_to_hex(text)
-    if t == "xyz":
-        return xyz_text_to_hex(text)
-    if t == "intent":
-        m = re.match(r"\s*(\d+)", text)
-        intent_val = int(m.group(1)) if m else next((k for k, v in RENDERING_INTENTS.items() if v.lower() == text.lower()), None)
-        if intent_val is None or intent_val not in RENDERING_INTENTS:
-            raise ValueError("Rendering intent must be 0-3")
-        return int_to_hex(intent_val, length)
-    raise ValueError(f"Unsupported field type {t}")
-
-
-def hex_to_human(field: Dict[str, object], hex_str: str) -> str:
-    t = field["type"]
-    if t in {"u32", "u64"}:
-        return str(int(hex_str, 16))
-    if t == "hex":
-        return hex_str.upper()
-    if t in {"sig", "sig-fixed", "choice", "sig-limited"}:
-        return hex_to_sig(hex_str)
-    if t == "version":
-        return hex_to_version(hex_str)
-    if t == "datetime":
-        return hex_to_datetime_text(hex_str)
-    if t == "xyz":
-        return hex_to_xyz_text(hex_str)
-    if t == "intent":
-        val = int(hex_str, 16)
-        return RENDERING_INTENTS.get(val, "Unknown")
-    return hex_str
-
-
-def normalize_hex_length(field: Dict[str, object], hex_str: str) -> str:
-    cleaned = clean_hex(hex_str).upper()
-    required = field["length"] * 2
+    x, y, z = (float(p) for p in parts)
+    return xyz_components_to_hex(x, y, z)
+
+
+def _h2h_int(length: int, text: str) -> str:
+    return int_to_hex(int(text), length)
+
+
+def _h2h_hex(length: int, text: str) -> str:
+    cleaned = canonical_hex(text)
+    return cleaned.zfill(length * 2)[: length * 2]
+
+
+def _h2h_sig(length: int, text: str) -> str:
+    return sig_to_hex(text.strip().ljust(4)[:4])
+
+
+def _h2h_sig_limited(length: int, text: str) -> str:
+    cleaned = text.rstrip()
+    if len(cleaned) > 4:
+        raise ValueError("Field must be 4 characters or fewer.")
+    if not cleaned:
+        return "00000000"
+    padded = cleaned.ljust(4)
+    return sig_to_hex(padded)
+
+
+def _h2h_choice(length: int, text: str) -> str:
+    if text.startswith("0000"):
+        return "00000000"
+    sig = text[:4]
+    return sig_to_hex(sig)
+
+
+def _h2h_intent(length: int, text: str) -> str:
+    m = _INTENT_RE.match(text)
+    intent_val = int(m.group(1)) if m else _INTENT_BY_NAME.get(text.lower())
+    if intent_val is None or intent_val not in RENDERING_INTENTS:
+        raise ValueError("Rendering intent must be 0-3")
+    return int_to_hex(intent_val, length)
+
+
+_HUMAN_TO_HEX: Dict[str, Callable[[int, str], str]] = {
+    "u32": _h2h_int,
+    "u64": _h2h_int,
+    "hex": _h2h_hex,
+    "sig": _h2h_sig,
+    "sig-fixed": _h2h_sig,
+    "sig-limited": _h2h_sig_limited,
+    "choice": _h2h_choice,
+    "version": lambda length, text: version_to_hex(text),
+    "datetime": lambda length, text: datetime_text_to_hex(text),
+    "xyz": lambda length, text: xyz_text_to_hex(text),
+    "intent": _h2h_intent,
+}
+
+
+@lru_cache(maxsize=1024)
+def _human_to_hex_impl(t: str, length: int, text: str) -> str:
+    conv = _HUMAN_TO_HEX.get(t)
+    if conv is None:
+        raise ValueError(f"Unsupported field type {t}")
+    return conv(length, text)
+
+
+def human_to_hex(field: HeaderField, text: str) -> str:
+    return _human_to_hex_impl(field.type, field.length, text)
+
+
+def _hex2h_int(hex_str: str) -> str:
+    return str(int(hex_str, 16))
+
+
+def _hex2h_intent(hex_str: str) -> str:
+    val = int(hex_str, 16)
+    return RENDERING_INTENTS.get(val, "Unknown")
+
+
+_HEX_TO_HUMAN: Dict[str, Callable[[str], str]] = {
+    "u32": _hex2h_int,
+    "u64": _hex2h_int,
+    "hex": str.upper,
+    "sig": hex_to_sig,
+    "sig-fixed": hex_to_sig,
+    "choice": hex_to_sig,
+    "sig-limited": hex_to_sig,
+    "version": hex_to_version,
+    "datetime": hex_to_datetime_text,
+    "xyz": hex_to_xyz_text,
+    "intent": _hex2h_intent,
+}
+
+
+@lru_cache(maxsize=1024)
+def _hex_to_human_impl(t: str, hex_str: str) -> str:
+    conv = _HEX_TO_HUMAN.get(t)
+    if conv is None:
+        return hex_str
+    return conv(hex_str)
+
+
+def hex_to_human(field: HeaderField, hex_str: str) -> str:
+    return _hex_to_human_impl(field.type, hex_str)
+
+
+_HEX_UPPER_SET = frozenset("0123456789ABCDEF")
+
+
+def normalize_hex_length(field: HeaderField, hex_str: str) -> str:
+    required = field.length * 2
+    # Stored/round-tripped values are already canonical and the right length
+    if len(hex_str) == required and _HEX_UPPER_SET.issuperset(hex_str):
+        return hex_str
+    cleaned = canonical_hex(hex_str)
     if len(cleaned) < required:
         cleaned = cleaned.ljust(required, "0")
     return cleaned[:required]
 
 
-def decode_flags(hex_str: str) -> Tuple[str, str]:
+# (label when bit clear, label when bit set, bit, prefix that selects the set state when encoding)
+_BitSpec = Tuple[Tuple[str, str, int, str], ...]
+_FLAG_SPEC: _BitSpec = (
+    ("Not embedded", "Embedded", 0x1, "embed"),  # bit0 = 1 => embedded
+    ("Independent", "Not independent", 0x2, "not"),  # bit1 = 1 => not independent
+)
+_ATTR_SPEC: _BitSpec = (
+    ("Reflective", "Transparency", 0x1, "trans"),
+    ("Glossy", "Matte", 0x2, "matte"),
+    ("Positive", "Negative", 0x4, "neg"),
+    ("Color", "Black & White", 0x8, "black"),
+)
+
+
+# Lowercased labels -> bit state per spec entry, so the combobox labels skip the prefix test
+def _bit_label_states(spec: _BitSpec) -> Tuple[Dict[str, bool], ...]:
+    return tuple({clear_label.lower(): False, set_label.lower(): True} for clear_label, set_label, _, _ in spec)
+
+
+_FLAG_STATES = _bit_label_states(_FLAG_SPEC)
+_ATTR_STATES = _bit_label_states(_ATTR_SPEC)
+
+
+def _decode_bits(spec: _BitSpec, hex_str: str) -> Tuple[str, ...]:
     val = int(hex_str, 16)
-    embedded = "Embedded" if val & 0x1 else "Not embedded"
-    independent = "Independent" if not (val & 0x2) else "Not independent"
-    return embedded, independent
+    return tuple(set_label if val & bit else clear_label for clear_label, set_label, bit, _ in spec)
 
 
-def encode_flags(embedded: str, independent: str) -> str:
+def _encode_bits(spec: _BitSpec, states: Tuple[Dict[str, bool], ...], texts: Tuple[str, ...]) -> int:
     val = 0
-    emb_txt = embedded.strip().lower()
-    indep_txt = independent.strip().lower()
-    if emb_txt.startswith("embed"):
-        val |= 0x1  # bit0 = 1 => embedded
-    if indep_txt.startswith("not"):
-        val |= 0x2  # bit1 = 1 => not independent
-    return int_to_hex(val, 4)
+    for (_, _, bit, prefix), known, text in zip(spec, states, texts):
+        t = text.strip().lower()
+        is_set = known.get(t)
+        if is_set is None:
+            is_set = t.startswith(prefix)
+        if is_set:
+            val |= bit
+    return val
+
+
+def decode_flags(hex_str: str) -> Tuple[str, str]:
+    return _decode_bits(_FLAG_SPEC, hex_str)
+
+
+def encode_flags(embedded: str, independent: str) -> str:
+    return int_to_hex(_encode_bits(_FLAG_SPEC, _FLAG_STATES, (embedded, independent)), 4)
 
 
 def decode_attributes(hex_str: str) -> Tuple[str, str, str, str]:
-    val = int(hex_str, 16)
-    reflective = "Reflective" if not (val & 0x1) else "Transparency"
-    gloss = "Glossy" if not (val & 0x2) else "Matte"
-    polarity = "Positive" if not (val & 0x4) else "Negative"
-    color = "Color" if not (val & 0x8) else "Black & White"
-    return reflective, gloss, polarity, color
+    return _decode_bits(_ATTR_SPEC, hex_str)
 
 
 def encode_attributes(reflective: str, gloss: str, polarity: str, color: str) -> str:
-    val = 0
-    if reflective.strip().lower().startswith("trans"):
-        val |= 0x1  # bit0
-    if gloss.strip().lower().startswith("matte"):
-        val |= 0x2  # bit1
-    if polarity.strip().lower().startswith("neg"):
-        val |= 0x4  # bit2
-    if color.strip().lower().startswith("black"):
-        val |= 0x8  # bit3
-    return int_to_hex(val, 8)
+    return int_to_hex(_encode_bits(_ATTR_SPEC, _ATTR_STATES, (reflective, gloss, polarity, color)), 8)
 
 
-def hex_to_xyz_components(hex_str: str) -> Tuple[float, float, float]:
-    if len(hex_str) < 24:
-        raise ValueError("XYZ needs 12 bytes")
-    x_raw, y_raw, z_raw = struct.unpack(">iii", bytes.fromhex(hex_str[:24]))
-    return tuple(from_s15fixed16(v) for v in (x_raw, y_raw, z_raw))
+_CHAD_IDENTITY = b"sf32\x00\x00\x00\x00" + float_to_s15fixed16_bytes(np.eye(3).ravel())
 
 
-def xyz_components_to_hex(x: float, y: float, z: float) -> str:
-    fixed = [to_s15fixed16(v) for v in (x, y, z)]
-    return struct.pack(">iii", *fixed).hex().upper()
+def chad_identity_bytes() -> bytes:
+    return _CHAD_IDENTITY
 
 
-def chad_identity_bytes() -> bytes:
-    values = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
-    fixed = [to_s15fixed16(v) for v in values]
-    return struct.pack(">4s4x" + "i" * 9, b"sf32", *fixed)
+_IDENTITY_MATRIX12: Tuple[float, ...] = (1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+
+
+def identity_matrix12() -> Tuple[float, ...]:
+    return _IDENTITY_MATRIX12
+
+
+def _compute_srgb_trc(entries: int = 1024) -> Tuple[int, ...]:
+    # sRGB curve per ICC recommendation, as u16 curveType entries
+    x = np.arange(entries, dtype=np.float64) / (entries - 1)
+    y = np.where(x <= 0.04045, x / 12.92, ((x + 0.055) / 1.055) ** 2.4)
+    return tuple(np.rint(y * 65535).astype(np.uint16).tolist())
+
+
+_SRGB_TRC_1024 = _compute_srgb_trc()
+
 
+# sf32 block of an evenly spaced 0..1 ramp; the same block serves all three MHC2 channels
+@lru_cache(maxsize=8)
+def identity_lut_block(count: int) -> bytes:
+    ramp = np.arange(count, dtype=np.float64) / (count - 1 if count > 1 else 1)
+    return b"sf32\x00\x00\x00\x00" + float_to_s15fixed16_bytes(ramp)
 
-def identity_matrix12() -> List[float]:
-    return [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+
+# Static header defaults; date_time is filled in per call (kept here so key order matches HEADER_FIELDS)
+_HEADER_DEFAULTS_STATIC: Dict[str, str] = {f.key: f.default_hex for f in HEADER_FIELDS}
+
+
+# Illuminant default (D50) pre-formatted for the header editor's "D50" button
+_D50_XYZ_TEXT: Tuple[str, str, str] = tuple(
+    f"{v:.4f}" for v in hex_to_xyz_components(_HEADER_DEFAULTS_STATIC["illuminant"])
+)
+
+
+def _icc_datetime_hex(dt: datetime) -> str:
+    return _DATETIME_STRUCT.pack(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second).hex().upper()
 
 
 def default_header_values_hex() -> Dict[str, str]:
-    now = datetime.now()
-    now_hex = datetime_text_to_hex(now.strftime("%Y-%m-%d %H:%M:%S"))
-    values = {}
-    for f in HEADER_FIELDS:
-        if f["key"] == "date_time":
-            values[f["key"]] = now_hex
-        else:
-            values[f["key"]] = f["default_hex"]
+    values = dict(_HEADER_DEFAULTS_STATIC)
+    values["date_time"] = _icc_datetime_hex(datetime.now())
     return values
 
 
-@dataclass
+# Tag payloads are stored canonically as bytes and the hex form is derived lazily for display.
+# Assigning data_hex keeps the text as given and parses it on first use, so malformed hex is
+# still reported when the profile is laid out rather than on assignment.
 class TagEntry:
-    signature: str
-    description: str
-    data_hex: str
-    offset: int = 0
+    __slots__ = ("signature", "description", "_hex", "_bytes", "_key", "_sig_bytes", "offset")
+
+    def __init__(self, signature: str, description: str, data: str | bytes, offset: int = 0):
+        self.signature = signature
+        self.description = description
+        self._sig_bytes = None
+        if isinstance(data, (bytes, bytearray)):
+            self.data = data
+        else:
+            self.data_hex = data
+        self.offset = offset
+
+    def __repr__(self) -> str:
+        return f"TagEntry(signature={self.signature!r}, description={self.description!r}, data_hex={self.data_hex!r}, offset={self.offset!r})"
+
+    @property
+    def sig_bytes(self) -> bytes:
+        if self._sig_bytes is None:
+            self._sig_bytes = self.signature.encode("ascii")
+        return self._sig_bytes
+
+    @property
+    def data(self) -> bytes:
+        return self.data_bytes()
+
+    @data.setter
+    def data(self, value: bytes) -> None:
+        self._bytes = bytes(value)
+        self._hex = None
+        self._key = None
+
+    @property
+    def data_hex(self) -> str:
+        if self._hex is None:
+            self._hex = self._bytes.hex().upper()
+        return self._hex
+
+    @data_hex.setter
+    def data_hex(self, value: str) -> None:
+        self._hex = value
+        self._bytes = None
+        self._key = None
+
+    # Short digest of the payload used to find identical tag data without hashing/comparing it in full
+    @property
+    def content_key(self) -> bytes:
+        if self._key is None:
+            self._key = hashlib.blake2b(self.data_bytes(), digest_size=16).digest()
+        return self._key
 
     def data_bytes(self) -> bytes:
-        cleaned = clean_hex(self.data_hex)
-        if len(cleaned) % 2:
-            raise ValueError(f"Tag {self.signature}: hex data must have an even number of characters.")
-        return bytes.fromhex(cleaned)
+        if self._bytes is None:
+            try:
+                self._bytes = bytes.fromhex(self._hex)
+            except ValueError:
+                cleaned = clean_hex(self._hex)
+                if len(cleaned) % 2:
+                    raise ValueError(f"Tag {self.signature}: hex data must have an even number of characters.")
+                self._bytes = bytes.fromhex(cleaned)
+        return self._bytes
 
     def size(self) -> int:
         return len(self.data_bytes())
 
 
+# Offsets per tag and total profile size, matching the layout written by _layout_tags
+def compute_tag_offsets(tags: List[TagEntry]) -> Tuple[List[int], int]:
+    base_offset = 128 + 4 + len(tags) * 12
+    slots: Dict[bytes, int] = {}
+    tag_slots: List[int] = []
+    sizes: List[int] = []
+    for tag in tags:
+        slot = slots.setdefault(tag.content_key, len(slots))
+        if slot == len(sizes):
+            sizes.append((tag.size() + 3) & ~3)
+        tag_slots.append(slot)
+    padded = np.array(sizes, dtype=np.int64)
+    ends = base_offset + np.cumsum(padded)
+    starts = ends - padded
+    total_size = int(ends[-1]) if len(ends) else base_offset
+    return starts[tag_slots].tolist(), total_size
+
+
 # Expanded tag library from ICC v4 plus Windows-specific tags
 KNOWN_TAG_LIBRARY: Dict[str, str] = {
     "A2B0": "AToB0 (PCS -> Device)",
@@ -506,23 +793,108 @@ KNOWN_TAG_LIBRARY: Dict[str, str] = {
     "wtpt": "Media white point",
 }
 
+# Search rows for the tag library, sorted by signature, with lowercase forms precomputed:
+# (sig, sig_lower, desc_lower, "sig - desc")
+_SEARCH_ENTRIES: List[Tuple[str, str, str, str]] = [
+    (sig, sig.lower(), desc.lower(), f"{sig} - {desc}") for sig, desc in sorted(KNOWN_TAG_LIBRARY.items())
+]
+
+# Decoded once at import; app instances copy these entries and share the immutable payloads
 DEFAULT_TAGS_SAMPLE: List[TagEntry] = [
-    TagEntry("cprt", "Copyright", "6D6C756300000000000000010000000C656E5553000000260000001C0043006F0070007900720069006700680074002000280043002900200055007300650072002E0000"),
-    TagEntry("rTRC", "Red tone reproduction curve", "63757276000000000000000102330000"),
-    TagEntry("gTRC", "Green tone reproduction curve", "63757276000000000000000102330000"),
-    TagEntry("bTRC", "Blue tone reproduction curve", "63757276000000000000000102330000"),
-    TagEntry("chad", "Chromatic adaptation", "7366333200000000000100000000000000000000000000000001000000000000000000000000000000010000"),
-    TagEntry("rXYZ", "Red colorant", "58595A2000000000000069930000366D000004F1"),
-    TagEntry("gXYZ", "Green colorant", "58595A200000000000005B8C0000B71700001E84"),
-    TagEntry("bXYZ", "Blue colorant", "58595A200000000000002E350000127C0000F354"),
-    TagEntry("wtpt", "Media white point", "58595A20000000000000F35100010000000116CC"),
-    TagEntry("MSCA", "Microsoft Color Adaptation", "74657874000000007B2741707076657273696F6E273A27312E302E3135322E30272C2744363541646170746564273A547275657D00"),
-    TagEntry("lumi", "Luminance", "58595A2000000000005000000050000000500000"),
-    TagEntry("MHC2", "Windows Advanced Color metadata", "4D4843320000000000000002000033330050000000000024000000540000006400000074000100000000000000000000000000000000000000010000000000000000000000000000000000000001000000000000736633320000000000000000000100007366333200000000000000000001000073663332000000000000000000010000"),
-    TagEntry("desc", "Profile description", "6D6C756300000000000000010000000C656E55530000002C0000001C00440065006600610075006C00740020004400650076006900630065002000500072006F00660069006C0065"),
+    TagEntry(sig, desc, bytes.fromhex(data))
+    for sig, desc, data in (
+        ("cprt", "Copyright", "6D6C756300000000000000010000000C656E5553000000260000001C0043006F0070007900720069006700680074002000280043002900200055007300650072002E0000"),
+        ("rTRC", "Red tone reproduction curve", "63757276000000000000000102330000"),
+        ("gTRC", "Green tone reproduction curve", "63757276000000000000000102330000"),
+        ("bTRC", "Blue tone reproduction curve", "63757276000000000000000102330000"),
+        ("chad", "Chromatic adaptation", "7366333200000000000100000000000000000000000000000001000000000000000000000000000000010000"),
+        ("rXYZ", "Red colorant", "58595A2000000000000069930000366D000004F1"),
+        ("gXYZ", "Green colorant", "58595A200000000000005B8C0000B71700001E84"),
+        ("bXYZ", "Blue colorant", "58595A200000000000002E350000127C0000F354"),
+        ("wtpt", "Media white point", "58595A20000000000000F35100010000000116CC"),
+        ("MSCA", "Microsoft Color Adaptation", "74657874000000007B2741707076657273696F6E273A27312E302E3135322E30272C2744363541646170746564273A547275657D00"),
+        ("lumi", "Luminance", "58595A2000000000005000000050000000500000"),
+        ("MHC2", "Windows Advanced Color metadata", "4D4843320000000000000002000033330050000000000024000000540000006400000074000100000000000000000000000000000000000000010000000000000000000000000000000000000001000000000000736633320000000000000000000100007366333200000000000000000001000073663332000000000000000000010000"),
+        ("desc", "Profile description", "6D6C756300000000000000010000000C656E55530000002C0000001C00440065006600610075006C00740020004400650076006900630065002000500072006F00660069006C0065"),
+    )
 ]
 
 
+def default_tags() -> List[TagEntry]:
+    return [TagEntry(t.signature, t.description, t.data) for t in DEFAULT_TAGS_SAMPLE]
+
+
+# Tags with a human editor, mapped to the workspace kind that edits them; everything else is hex-only
+_WORKSPACE_KIND_BY_SIG: Dict[str, str] = {
+    "cprt": "mluc",
+    "desc": "mluc",
+    "rXYZ": "xyz",
+    "gXYZ": "xyz",
+    "bXYZ": "xyz",
+    "wtpt": "xyz",
+    "lumi": "lumi",
+    "MSCA": "msca",
+    "MHC2": "mhc2",
+    "rTRC": "trc",
+    "gTRC": "trc",
+    "bTRC": "trc",
+}
+
+
+_HEX_VIEW_CHUNK_LINES = 256
+# Offset column strings for the first 64 KiB of a tag; longer payloads format the remainder
+_OFFSET_LINES: List[str] = [f"{i:04X}" for i in range(0, 1 << 16, 16)]
+_BYTE_HEX: Tuple[str, ...] = tuple(f"{i:02X}" for i in range(256))
+# Column header of the hex view: "00 01 02 03  04 05 06 07  ..."
+_HEX_VIEW_HEADER = "  ".join(" ".join(_BYTE_HEX[x] for x in range(g, g + 4)) for g in range(0x0, 0x10, 4))
+
+
+# Offset and hex text for 16-byte lines [start, end) of data. Lines are sliced out of one
+# bytes.hex(" ") string (3 chars per byte) and re-joined with the double space between 4-byte
+# groups, so no per-byte formatting happens in Python.
+def hex_view_lines(data: bytes, start: int, end: int) -> Tuple[List[str], List[str]]:
+    chunk = data[start * 16 : end * 16]
+    full_len = len(chunk) - len(chunk) % 16
+    spaced = chunk.hex(" ").upper()
+    hex_lines = [
+        "  ".join((spaced[b : b + 11], spaced[b + 12 : b + 23], spaced[b + 24 : b + 35], spaced[b + 36 : b + 47]))
+        for b in range(0, full_len * 3, 48)
+    ]
+    if full_len < len(chunk):
+        tail = spaced[full_len * 3 :]
+        hex_lines.append("  ".join(tail[g : g + 11] for g in range(0, len(tail), 12)))
+    end = start + len(hex_lines)
+    offset_lines = _OFFSET_LINES[start:end]
+    if end > len(_OFFSET_LINES):
+        offset_lines += [f"{i:04X}" for i in range(max(start, len(_OFFSET_LINES)) * 16, end * 16, 16)]
+    return offset_lines, hex_lines
+
+
+def profile_md5(pieces: Tuple[bytes, ...]) -> bytes:
+    md = hashlib.md5(usedforsecurity=False)
+    for piece in pieces:
+        md.update(piece)
+    return md.digest()
+
+
+def join_profile(pieces: Tuple[bytes, bytes, bytes], digest: bytes) -> bytes:
+    header, tag_table, data_blocks = pieces
+    return b"".join((header[:84], digest, header[100:], tag_table, data_blocks))
+
+
+# Runs on the save worker for large profiles, so it must not touch Tk
+def write_profile(path: str, pieces: Tuple[bytes, bytes, bytes]) -> bytes:
+    digest = profile_md5(pieces)
+    with open(path, "wb") as f:
+        f.write(join_profile(pieces, digest))
+    return digest
+
+
+# Profiles at least this large are hashed and written off the Tk thread
+_BACKGROUND_SAVE_MIN_SIZE = 1 << 20
+_SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+
 class ScrollableFrame(ttk.Frame):
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
@@ -535,13 +907,23 @@ class ScrollableFrame(ttk.Frame):
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
         self.canvas.bind("<Configure>", lambda e: self._toggle_scrollbar())
+        self._region_pending = False
 
+    # Gridding many rows fires <Configure> once per row; coalesce them into one update per idle turn
     def _update_region(self, _=None):
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        self._toggle_scrollbar()
+        if not self._region_pending:
+            self._region_pending = True
+            self.after_idle(self._do_update_region)
 
-    def _toggle_scrollbar(self):
+    def _do_update_region(self):
+        self._region_pending = False
         bbox = self.canvas.bbox("all")
+        self.canvas.configure(scrollregion=bbox)
+        self._toggle_scrollbar(bbox)
+
+    def _toggle_scrollbar(self, bbox=None):
+        if bbox is None:
+            bbox = self.canvas.bbox("all")
         if not bbox:
             return
         needs_scroll = bbox[3] - bbox[1] > self.canvas.winfo_height()
@@ -566,8 +948,44 @@ class ICCBuilderApp:
         self.header_vars: Dict[str, tk.StringVar] = {}
         self.header_values_hex: Dict[str, str] = default_header_values_hex()
         self.header_widgets: Dict[str, tk.Widget] = {}
-        self.tags: List[TagEntry] = [TagEntry(t.signature, t.description, t.data_hex) for t in DEFAULT_TAGS_SAMPLE]
+        self.header_kinds: Dict[str, str] = {}
+        self.header_rows: Dict[str, int] = {}
+        # Widgets/variables already built per (field key, widget kind); toggling modes re-grids these
+        self._header_widget_cache: Dict[Tuple[str, str], Tuple[tk.Widget, object]] = {}
+        # (mode, header values) the widgets currently show; cleared whenever a header variable is written
+        self._header_render_sig: Tuple[str, Tuple[Tuple[str, str], ...]] | None = None
+        self.header_scroll: ScrollableFrame | None = None
+        self._batching = False
+        self._pending_ui: set = set()
+        self._save_future: Future | None = None
+        self.tags: List[TagEntry] = []
+        self._tags_by_sig: Dict[str, TagEntry] = {}
+        self._tag_index: Dict[str, int] = {}  # position of the tag _tags_by_sig holds for each signature
+        self._existing_sigs: frozenset = frozenset()
+        self._trc_tags: List[TagEntry] = []
+        self._set_tags(default_tags())
         self.selected_tag: TagEntry | None = None
+        self._tag_row_cache: Dict[str, Tuple[object, ...]] = {}
+        self._offsets_cache: Tuple[Tuple[bytes, ...], List[int], int] | None = None
+        self._hex_pending: List[object] | None = None  # [data, next line] still to be inserted
+        self._hex_render_job: str | None = None
+        self._search_cache: Dict[Tuple[str, frozenset], Tuple[List[Tuple[str, str, str, str]], List[str]]] = {}
+        # Last (query, existing signatures, matching entries); a query extending it only narrows those entries
+        self._search_last: Tuple[str, frozenset, List[Tuple[str, str, str, str]]] | None = None
+        self._search_after_id: str | None = None
+        self._search_rows_shown: List[str] | None = None
+        # Bumped whenever mluc_records changes; the cached layout is reused while its stamp matches
+        self._mluc_layout_version = 0
+        self._mluc_layout_cache: Tuple[int, List[Dict[str, int]]] | None = None
+        self._mluc_combo_strings: List[str] = []  # labels currently listed in mluc_combo
+        self._workspace_renderers = {
+            "mluc": self.render_mluc_workspace,
+            "xyz": self.render_xyz_workspace,
+            "lumi": self.render_lumi_workspace,
+            "msca": self.render_msca_workspace,
+            "mhc2": self.render_mhc2_workspace,
+            "trc": self.render_trc_workspace,
+        }
         self._build_menu()
         self._build_layout()
         self.refresh_tag_table()
@@ -613,149 +1031,24 @@ class ICCBuilderApp:
         self.header_container.pack(fill="both", expand=True)
         self.render_header_fields()
 
-    def render_header_fields(self):
-        for child in self.header_container.winfo_children():
-            child.destroy()
-
+    def _build_header_skeleton(self):
         top = ttk.Frame(self.header_container)
         top.pack(fill="x", padx=4, pady=4)
-        ttk.Label(top, text=f"Mode: {'Human' if self.header_mode=='human' else 'Hex'}").pack(side="left")
-        ttk.Button(
-            top,
-            text="Show Hex" if self.header_mode == "human" else "Show Human",
-            command=self.toggle_header_mode,
-        ).pack(side="right")
-
-        scroll = ScrollableFrame(self.header_container)
-        scroll.pack(fill="both", expand=True)
+        self.header_mode_label = ttk.Label(top)
+        self.header_mode_label.pack(side="left")
+        self.header_mode_btn = ttk.Button(top, command=self.toggle_header_mode)
+        self.header_mode_btn.pack(side="right")
 
-        self.header_vars.clear()
-        self.header_widgets.clear()
+        self.header_scroll = ScrollableFrame(self.header_container)
+        self.header_scroll.pack(fill="both", expand=True)
+        self.header_scroll.inner.columnconfigure(1, weight=1)
 
         row = 0
-        for field in HEADER_FIELDS:
-            if field.get("hidden"):
-                continue
-
-            label = ttk.Label(scroll.inner, text=field["label"])
-            label.grid(row=row, column=0, sticky="w", padx=4, pady=2)
-            hex_value = self.header_values_hex[field["key"]]
-
-            # Default widget and value handling
-            widget = None
-            var: tk.Variable | Tuple[tk.Variable, ...]
-
-            if field["type"] == "choice" and self.header_mode == "human":
-                if hex_value == "00000000":
-                    sig = "0000"
-                    desc = field["choices"].get("0000", "Empty (zero)")
-                else:
-                    sig = hex_to_sig(hex_value)
-                    desc = field["choices"].get(sig, "Unknown choice")
-                display_value = f"{sig} - {desc}"
-                var = tk.StringVar(value=display_value)
-                values = [f"{sig} - {desc}" for sig, desc in field["choices"].items()]
-                widget = ttk.Combobox(scroll.inner, textvariable=var, values=values, state="readonly", width=26)
-
-            elif field["type"] == "size":
-                display_value = str(int(hex_value, 16)) if self.header_mode == "human" else hex_value
-                var = tk.StringVar(value=display_value)
-                widget = ttk.Entry(scroll.inner, textvariable=var, width=32, state="disabled")
-
-            elif field["type"] == "datetime-fixed":
-                display_value = hex_to_datetime_text(hex_value) if self.header_mode == "human" else hex_value
-                var = tk.StringVar(value=display_value)
-                widget = ttk.Entry(scroll.inner, textvariable=var, width=40, state="disabled")
-
-            elif field["type"] == "flags" and self.header_mode == "human":
-                emb, indep = decode_flags(hex_value)
-                var_emb = tk.StringVar(value=emb)
-                var_indep = tk.StringVar(value=indep)
-                frame = ttk.Frame(scroll.inner)
-                ttk.Combobox(frame, textvariable=var_emb, values=["Embedded", "Not embedded"], state="readonly", width=14).pack(side="left", padx=(0, 6))
-                ttk.Combobox(frame, textvariable=var_indep, values=["Independent", "Not independent"], state="readonly", width=16).pack(side="left")
-                widget = frame
-                var = (var_emb, var_indep)
-
-            elif field["type"] == "attributes" and self.header_mode == "human":
-                ref, gloss, pol, color = decode_attributes(hex_value)
-                options = {
-                    "ref": ["Reflective", "Transparency"],
-                    "gloss": ["Glossy", "Matte"],
-                    "pol": ["Positive", "Negative"],
-                    "color": ["Color", "Black & white"],
-                }
-                vars_tuple = (
-                    tk.StringVar(value=ref),
-                    tk.StringVar(value=gloss),
-                    tk.StringVar(value=pol),
-                    tk.StringVar(value=color),
-                )
-                frame = ttk.Frame(scroll.inner)
-                ttk.Combobox(frame, textvariable=vars_tuple[0], values=options["ref"], state="readonly", width=12).pack(side="left", padx=(0, 4))
-                ttk.Combobox(frame, textvariable=vars_tuple[1], values=options["gloss"], state="readonly", width=12).pack(side="left", padx=(0, 4))
-                ttk.Combobox(frame, textvariable=vars_tuple[2], values=options["pol"], state="readonly", width=12).pack(side="left", padx=(0, 4))
-                ttk.Combobox(frame, textvariable=vars_tuple[3], values=options["color"], state="readonly", width=14).pack(side="left", padx=(0, 4))
-                widget = frame
-                var = vars_tuple
-
-            elif field["type"] == "illuminant" and self.header_mode == "human":
-                x, y, z = hex_to_xyz_components(hex_value)
-                vars_tuple = (
-                    tk.StringVar(value=f"{x:.6f}"),
-                    tk.StringVar(value=f"{y:.6f}"),
-                    tk.StringVar(value=f"{z:.6f}"),
-                )
-                d50_vals = hex_to_xyz_components(next(f["default_hex"] for f in HEADER_FIELDS if f["key"] == "illuminant"))
-                frame = ttk.Frame(scroll.inner)
-                ttk.Label(frame, text="X=").pack(side="left")
-                ttk.Entry(frame, textvariable=vars_tuple[0], width=8).pack(side="left", padx=(2, 6))
-                ttk.Label(frame, text="Y=").pack(side="left")
-                ttk.Entry(frame, textvariable=vars_tuple[1], width=8).pack(side="left", padx=(2, 6))
-                ttk.Label(frame, text="Z=").pack(side="left")
-                ttk.Entry(frame, textvariable=vars_tuple[2], width=8).pack(side="left", padx=(2, 6))
-                ttk.Button(
-                    frame,
-                    text="D50",
-                    command=lambda v=vars_tuple, d=d50_vals: [v[0].set(f"{d[0]:.4f}"), v[1].set(f"{d[1]:.4f}"), v[2].set(f"{d[2]:.4f}")],
-                ).pack(side="left", padx=(6, 0))
-                widget = frame
-                var = vars_tuple
-
-            elif field["type"] in {"sig-fixed"}:
-                display_value = hex_value if self.header_mode == "hex" else hex_to_human(field, hex_value)
-                var = tk.StringVar(value=display_value)
-                widget = ttk.Entry(scroll.inner, textvariable=var, width=40, state="disabled")
-
-            elif field["type"] == "profile_id":
-                display_value = hex_value if self.header_mode == "hex" else hex_to_human(field, hex_value)
-                var = tk.StringVar(value=display_value)
-                widget = ttk.Entry(scroll.inner, textvariable=var, width=40, state="disabled")
-
-            elif field["type"] == "intent" and self.header_mode == "human":
-                val = hex_to_human(field, hex_value)
-                var = tk.StringVar(value=val)
-                widget = ttk.Combobox(
-                    scroll.inner,
-                    textvariable=var,
-                    values=list(RENDERING_INTENTS.values()),
-                    state="readonly",
-                    width=30,
-                )
-
-            else:
-                display_value = hex_value if self.header_mode == "hex" else hex_to_human(field, hex_value)
-                var = tk.StringVar(value=display_value)
-                widget = ttk.Entry(scroll.inner, textvariable=var, width=32)
-
-            widget.grid(row=row, column=1, sticky="ew", padx=4, pady=2)
-            scroll.inner.columnconfigure(1, weight=1)
-            self.header_vars[field["key"]] = var
-            self.header_widgets[field["key"]] = widget
+        for field in _HEADER_VISIBLE:
+            ttk.Label(self.header_scroll.inner, text=field.label).grid(row=row, column=0, sticky="w", padx=4, pady=2)
+            self.header_rows[field.key] = row
             row += 1
 
-        scroll.update_scroll()
-
         # Footnotes
         foot = ttk.Label(
             self.header_container,
@@ -767,6 +1060,160 @@ class ICCBuilderApp:
         )
         foot.pack(fill="x", padx=6, pady=4)
 
+    def _header_widget_kind(self, field: HeaderField) -> str:
+        t = field.type
+        if t in {"size", "datetime-fixed", "sig-fixed", "profile_id"}:
+            return "readonly"
+        if self.header_mode == "human" and t in {"choice", "flags", "attributes", "illuminant", "intent"}:
+            return t
+        return "entry"
+
+    def _header_display_values(self, field: HeaderField, kind: str, hex_value: str) -> Tuple[str, ...]:
+        t = field.type
+        human = self.header_mode == "human"
+        if kind == "choice":
+            if hex_value == "00000000":
+                sig = "0000"
+                desc = field.choices.get("0000", "Empty (zero)")
+            else:
+                sig = hex_to_sig(hex_value)
+                desc = field.choices.get(sig, "Unknown choice")
+            return (f"{sig} - {desc}",)
+        if kind == "flags":
+            return decode_flags(hex_value)
+        if kind == "attributes":
+            return decode_attributes(hex_value)
+        if kind == "illuminant":
+            return tuple(f"{v:.6f}" for v in hex_to_xyz_components(hex_value))
+        if not human:
+            return (hex_value,)
+        if t == "size":
+            return (str(int(hex_value, 16)),)
+        if t == "datetime-fixed":
+            return (hex_to_datetime_text(hex_value),)
+        return (hex_to_human(field, hex_value),)
+
+    def _create_header_widget(self, field: HeaderField, kind: str, values: Tuple[str, ...]):
+        inner = self.header_scroll.inner
+        if kind == "choice":
+            var = tk.StringVar(value=values[0])
+            widget = ttk.Combobox(inner, textvariable=var, values=field.choices_values, state="readonly", width=26)
+            return widget, var
+
+        if kind == "readonly":
+            var = tk.StringVar(value=values[0])
+            widget = ttk.Entry(inner, textvariable=var, width=32 if field.type == "size" else 40, state="disabled")
+            return widget, var
+
+        if kind == "flags":
+            var_emb = tk.StringVar(value=values[0])
+            var_indep = tk.StringVar(value=values[1])
+            frame = ttk.Frame(inner)
+            ttk.Combobox(frame, textvariable=var_emb, values=["Embedded", "Not embedded"], state="readonly", width=14).pack(side="left", padx=(0, 6))
+            ttk.Combobox(frame, textvariable=var_indep, values=["Independent", "Not independent"], state="readonly", width=16).pack(side="left")
+            return frame, (var_emb, var_indep)
+
+        if kind == "attributes":
+            options = {
+                "ref": ["Reflective", "Transparency"],
+                "gloss": ["Glossy", "Matte"],
+                "pol": ["Positive", "Negative"],
+                "color": ["Color", "Black & white"],
+            }
+            vars_tuple = tuple(tk.StringVar(value=v) for v in values)
+            frame = ttk.Frame(inner)
+            ttk.Combobox(frame, textvariable=vars_tuple[0], values=options["ref"], state="readonly", width=12).pack(side="left", padx=(0, 4))
+            ttk.Combobox(frame, textvariable=vars_tuple[1], values=options["gloss"], state="readonly", width=12).pack(side="left", padx=(0, 4))
+            ttk.Combobox(frame, textvariable=vars_tuple[2], values=options["pol"], state="readonly", width=12).pack(side="left", padx=(0, 4))
+            ttk.Combobox(frame, textvariable=vars_tuple[3], values=options["color"], state="readonly", width=14).pack(side="left", padx=(0, 4))
+            return frame, vars_tuple
+
+        if kind == "illuminant":
+            vars_tuple = tuple(tk.StringVar(value=v) for v in values)
+            frame = ttk.Frame(inner)
+            ttk.Label(frame, text="X=").pack(side="left")
+            ttk.Entry(frame, textvariable=vars_tuple[0], width=8).pack(side="left", padx=(2, 6))
+            ttk.Label(frame, text="Y=").pack(side="left")
+            ttk.Entry(frame, textvariable=vars_tuple[1], width=8).pack(side="left", padx=(2, 6))
+            ttk.Label(frame, text="Z=").pack(side="left")
+            ttk.Entry(frame, textvariable=vars_tuple[2], width=8).pack(side="left", padx=(2, 6))
+            ttk.Button(
+                frame,
+                text="D50",
+                command=lambda v=vars_tuple: [var.set(text) for var, text in zip(v, _D50_XYZ_TEXT)],
+            ).pack(side="left", padx=(6, 0))
+            return frame, vars_tuple
+
+        if kind == "intent":
+            var = tk.StringVar(value=values[0])
+            widget = ttk.Combobox(
+                inner,
+                textvariable=var,
+                values=list(RENDERING_INTENTS.values()),
+                state="readonly",
+                width=30,
+            )
+            return widget, var
+
+        var = tk.StringVar(value=values[0])
+        widget = ttk.Entry(inner, textvariable=var, width=32)
+        return widget, var
+
+    @staticmethod
+    def _set_header_var(var, values: Tuple[str, ...]):
+        if isinstance(var, tuple):
+            for v, text in zip(var, values):
+                v.set(text)
+        else:
+            var.set(values[0])
+
+    def render_header_fields(self):
+        if self._batching:
+            self._pending_ui.add("header")
+            return
+        # The frame, labels and each field's widget per kind are built once; later renders only
+        # update variables, and a mode switch swaps which cached widget is gridded.
+        render_sig = (self.header_mode, tuple(self.header_values_hex.items()))
+        if render_sig == self._header_render_sig:
+            return
+        if self.header_scroll is None:
+            self._build_header_skeleton()
+
+        self.header_mode_label.configure(text=f"Mode: {'Human' if self.header_mode=='human' else 'Hex'}")
+        self.header_mode_btn.configure(text="Show Hex" if self.header_mode == "human" else "Show Human")
+
+        for field in _HEADER_VISIBLE:
+            key = field.key
+            kind = self._header_widget_kind(field)
+            values = self._header_display_values(field, kind, self.header_values_hex[key])
+
+            if self.header_kinds.get(key) == kind:
+                self._set_header_var(self.header_vars[key], values)
+                continue
+
+            old = self.header_widgets.get(key)
+            if old is not None:
+                old.grid_remove()
+            cached = self._header_widget_cache.get((key, kind))
+            if cached is None:
+                widget, var = self._create_header_widget(field, kind, values)
+                for v in var if isinstance(var, tuple) else (var,):
+                    v.trace_add("write", self._invalidate_header_render)
+                self._header_widget_cache[(key, kind)] = (widget, var)
+            else:
+                widget, var = cached
+                self._set_header_var(var, values)
+            widget.grid(row=self.header_rows[key], column=1, sticky="ew", padx=4, pady=2)
+            self.header_vars[key] = var
+            self.header_widgets[key] = widget
+            self.header_kinds[key] = kind
+
+        self.header_scroll.update_scroll()
+        self._header_render_sig = render_sig
+
+    def _invalidate_header_render(self, *_):
+        self._header_render_sig = None
+
     def toggle_header_mode(self):
         try:
             self.header_values_hex = self.collect_header_hex()
@@ -783,7 +1230,7 @@ class ICCBuilderApp:
         self.search_var = tk.StringVar()
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
         search_entry.pack(side="left", fill="x", expand=True, padx=4)
-        search_entry.bind("<KeyRelease>", lambda _: self.refresh_search_results())
+        search_entry.bind("<KeyRelease>", lambda _: self._schedule_search())
         ttk.Button(search_frame, text="Add Selected", command=self.add_from_search).pack(side="left", padx=2)
 
         self.search_list = tk.Listbox(parent, height=6)
@@ -825,31 +1272,51 @@ class ICCBuilderApp:
         self.workspace_container = ttk.Frame(parent)
         self.workspace_container.pack(fill="both", expand=True, padx=4, pady=4)
 
-        # Hex workspace
+        # Keystroke validators for the human workspaces' entries ("%P" is the would-be new text)
+        self._vcmd_number = (self.root.register(lambda text: _PARTIAL_NUMBER_RE.fullmatch(text) is not None), "%P")
+        self._vcmd_code2 = (self.root.register(lambda text: len(text) <= 2 and (text == "" or text.isalpha())), "%P")
+
+        # Hex workspace; its labels and text widgets share one monospace font object
+        self._mono_font = tkfont.Font(root=self.root, family="Courier New", size=10)
         self.hex_frame = ttk.Frame(self.workspace_container)
         header_bar = ttk.Frame(self.hex_frame)
         header_bar.pack(fill="x", pady=(0, 2))
-        ttk.Label(header_bar, text=" " * 6, font=("Courier New", 10), width=6).pack(side="left", padx=(0, 8))
-        self.hex_header = ttk.Label(header_bar, text="", font=("Courier New", 10))
+        ttk.Label(header_bar, text=" " * 6, font=self._mono_font, width=6).pack(side="left", padx=(0, 8))
+        self.hex_header = ttk.Label(header_bar, text=_HEX_VIEW_HEADER, font=self._mono_font)
         self.hex_header.pack(side="left")
 
         body = ttk.Frame(self.hex_frame)
         body.pack(fill="both", expand=True)
 
-        self.offset_text = tk.Text(body, width=6, height=25, wrap="none", font=("Courier New", 10))
+        self.offset_text = tk.Text(body, width=6, height=25, wrap="none", font=self._mono_font)
         self.offset_text.configure(state="disabled")
         self.offset_text.pack(side="left", fill="y")
 
         scrollbar = ttk.Scrollbar(body, orient="vertical")
         scrollbar.pack(side="right", fill="y")
 
-        self.hex_text = tk.Text(body, height=25, wrap="none", font=("Courier New", 10), yscrollcommand=scrollbar.set)
+        self.hex_text = tk.Text(body, height=25, wrap="none", font=self._mono_font, yscrollcommand=scrollbar.set)
         self.hex_text.pack(side="left", fill="both", expand=True)
         self.hex_text.configure(state="disabled")
         scrollbar.config(command=self._sync_scroll)
         self.offset_text.config(yscrollcommand=scrollbar.set)
 
-        # Human mluc workspace
+        ttk.Button(parent, text="Save ICC Profile…", command=self.save_profile).pack(side="right", padx=8, pady=6)
+        # The human workspaces are built on first use; see _ensure_workspace
+        self._workspace_frames: Dict[str, ttk.Frame] = {"hex": self.hex_frame}
+        self._active_workspace_frame: ttk.Frame | None = None
+        self.show_hex_workspace()
+
+    def _ensure_workspace(self, kind: str) -> ttk.Frame:
+        frame = self._workspace_frames.get(kind)
+        if frame is None:
+            getattr(self, f"_build_{kind}_workspace")()
+            frame = getattr(self, f"{kind}_frame")
+            self._workspace_frames[kind] = frame
+        return frame
+
+    # Human mluc workspace
+    def _build_mluc_workspace(self):
         self.mluc_frame = ttk.Frame(self.workspace_container)
         mluc_top = ttk.Frame(self.mluc_frame)
         mluc_top.pack(fill="x", pady=(0, 6))
@@ -867,13 +1334,13 @@ class ICCBuilderApp:
 
         ttk.Label(form, text="Language (2 chars):").grid(row=0, column=0, sticky="w", padx=4, pady=2)
         self.mluc_lang = tk.StringVar()
-        ttk.Entry(form, textvariable=self.mluc_lang, width=8).grid(row=0, column=1, sticky="w", padx=4)
+        ttk.Entry(form, textvariable=self.mluc_lang, width=8, validate="key", validatecommand=self._vcmd_code2).grid(row=0, column=1, sticky="w", padx=4)
         self.mluc_lang_info = ttk.Label(form, text="")
         self.mluc_lang_info.grid(row=0, column=2, sticky="w", padx=4)
 
         ttk.Label(form, text="Country (2 chars):").grid(row=1, column=0, sticky="w", padx=4, pady=2)
         self.mluc_country = tk.StringVar()
-        ttk.Entry(form, textvariable=self.mluc_country, width=8).grid(row=1, column=1, sticky="w", padx=4)
+        ttk.Entry(form, textvariable=self.mluc_country, width=8, validate="key", validatecommand=self._vcmd_code2).grid(row=1, column=1, sticky="w", padx=4)
         self.mluc_country_info = ttk.Label(form, text="")
         self.mluc_country_info.grid(row=1, column=2, sticky="w", padx=4)
 
@@ -889,17 +1356,19 @@ class ICCBuilderApp:
         self.mluc_text = tk.Text(self.mluc_frame, height=10, wrap="word")
         self.mluc_text.pack(fill="both", expand=True, padx=4, pady=(0, 4))
 
-        # Human luminance workspace
+    # Human luminance workspace
+    def _build_lumi_workspace(self):
         self.lumi_frame = ttk.Frame(self.workspace_container)
         lumi_row = ttk.Frame(self.lumi_frame)
         lumi_row.pack(fill="x", pady=6)
         ttk.Label(lumi_row, text="Luminance (cd/m²):").pack(side="left", padx=4)
         self.lumi_value = tk.StringVar()
-        ttk.Entry(lumi_row, textvariable=self.lumi_value, width=16).pack(side="left", padx=4)
+        ttk.Entry(lumi_row, textvariable=self.lumi_value, width=16, validate="key", validatecommand=self._vcmd_number).pack(side="left", padx=4)
         self.lumi_xyz_label = ttk.Label(self.lumi_frame, text="XYZ: -")
         self.lumi_xyz_label.pack(anchor="w", padx=4, pady=(4, 2))
 
-        # Human MSCA workspace (textType) with warning
+    # Human MSCA workspace (textType) with warning
+    def _build_msca_workspace(self):
         self.msca_frame = ttk.Frame(self.workspace_container)
         warn = ttk.Label(self.msca_frame, text="Warning: MSCA is a Microsoft private tag. Editing may break compatibility.", foreground="red")
         warn.pack(anchor="w", padx=4, pady=(4, 6))
@@ -907,7 +1376,8 @@ class ICCBuilderApp:
         self.msca_text = tk.Text(self.msca_frame, height=10, wrap="word")
         self.msca_text.pack(fill="both", expand=True, padx=4, pady=(0, 4))
 
-        # Human MHC2 workspace
+    # Human MHC2 workspace
+    def _build_mhc2_workspace(self):
         self.mhc2_frame = ttk.Frame(self.workspace_container)
         mhc2_form = ttk.Frame(self.mhc2_frame)
         mhc2_form.pack(fill="x", pady=4)
@@ -924,8 +1394,8 @@ class ICCBuilderApp:
         self.mhc2_lut_b = tk.StringVar()
         self.mhc2_entries = tk.StringVar()
 
-        ttk.Entry(mhc2_form, textvariable=self.mhc2_min, width=16).grid(row=0, column=1, sticky="w", padx=4)
-        ttk.Entry(mhc2_form, textvariable=self.mhc2_peak, width=16).grid(row=1, column=1, sticky="w", padx=4)
+        ttk.Entry(mhc2_form, textvariable=self.mhc2_min, width=16, validate="key", validatecommand=self._vcmd_number).grid(row=0, column=1, sticky="w", padx=4)
+        ttk.Entry(mhc2_form, textvariable=self.mhc2_peak, width=16, validate="key", validatecommand=self._vcmd_number).grid(row=1, column=1, sticky="w", padx=4)
         ttk.Entry(mhc2_form, textvariable=self.mhc2_max_full, width=16, state="disabled").grid(row=2, column=1, sticky="w", padx=4)
 
         matrix_group = ttk.LabelFrame(self.mhc2_frame, text="Matrix (3x4 XYZ->XYZ)")
@@ -936,14 +1406,11 @@ class ICCBuilderApp:
         ttk.Entry(offset_row, textvariable=self.mhc2_matrix_off, width=16, state="disabled").pack(side="left")
         matrix_table = ttk.Frame(matrix_group)
         matrix_table.pack(padx=4, pady=(2, 6), anchor="w")
-        self.mhc2_matrix_vars = []
-        for r in range(3):
-            row_vars = []
-            for c in range(4):
-                var = tk.StringVar()
-                ttk.Entry(matrix_table, textvariable=var, width=10).grid(row=r, column=c, padx=2, pady=2)
-                row_vars.append(var)
-            self.mhc2_matrix_vars.append(row_vars)
+        # Row-major 3x4, matching the order the matrix is stored in the tag
+        self.mhc2_matrix_vars = [tk.StringVar() for _ in range(12)]
+        for idx, var in enumerate(self.mhc2_matrix_vars):
+            r, c = divmod(idx, 4)
+            ttk.Entry(matrix_table, textvariable=var, width=10).grid(row=r, column=c, padx=2, pady=2)
         btns = ttk.Frame(matrix_group)
         btns.pack(fill="x", padx=4, pady=(0, 6))
         ttk.Button(btns, text="Load matrix from CSV…", command=self.load_mhc2_matrix_csv).pack(side="left", padx=(0, 6))
@@ -984,7 +1451,8 @@ class ICCBuilderApp:
         self.mhc2_status = ttk.Label(self.mhc2_frame, text="", foreground="green")
         self.mhc2_status.pack_forget()
 
-        # Human TRC workspace
+    # Human TRC workspace
+    def _build_trc_workspace(self):
         self.trc_frame = ttk.Frame(self.workspace_container)
         trc_top = ttk.Frame(self.trc_frame)
         trc_top.pack(fill="x", pady=4)
@@ -1006,7 +1474,8 @@ class ICCBuilderApp:
         self.trc_status = ttk.Label(self.trc_frame, text="", foreground="green")
         self.trc_status.pack(anchor="w", padx=4, pady=(2, 0))
 
-        # Human XYZ workspace
+    # Human XYZ workspace
+    def _build_xyz_workspace(self):
         self.xyz_frame = ttk.Frame(self.workspace_container)
         xyz_form = ttk.Frame(self.xyz_frame)
         xyz_form.pack(fill="x", pady=6)
@@ -1016,9 +1485,9 @@ class ICCBuilderApp:
         self.xyz_x = tk.StringVar()
         self.xyz_y = tk.StringVar()
         self.xyz_z = tk.StringVar()
-        ttk.Entry(xyz_form, textvariable=self.xyz_x, width=18).grid(row=0, column=1, sticky="w", padx=4)
-        ttk.Entry(xyz_form, textvariable=self.xyz_y, width=18).grid(row=1, column=1, sticky="w", padx=4)
-        ttk.Entry(xyz_form, textvariable=self.xyz_z, width=18).grid(row=2, column=1, sticky="w", padx=4)
+        ttk.Entry(xyz_form, textvariable=self.xyz_x, width=18, validate="key", validatecommand=self._vcmd_number).grid(row=0, column=1, sticky="w", padx=4)
+        ttk.Entry(xyz_form, textvariable=self.xyz_y, width=18, validate="key", validatecommand=self._vcmd_number).grid(row=1, column=1, sticky="w", padx=4)
+        ttk.Entry(xyz_form, textvariable=self.xyz_z, width=18, validate="key", validatecommand=self._vcmd_number).grid(row=2, column=1, sticky="w", padx=4)
 
         # xyY inputs
         ttk.Label(xyz_form, text="x:").grid(row=0, column=2, sticky="w", padx=12, pady=2)
@@ -1027,14 +1496,14 @@ class ICCBuilderApp:
         self.xy_input_x = tk.StringVar()
         self.xy_input_y = tk.StringVar()
         self.xy_input_Y = tk.StringVar()
-        ttk.Entry(xyz_form, textvariable=self.xy_input_x, width=12).grid(row=0, column=3, sticky="w", padx=4)
-        ttk.Entry(xyz_form, textvariable=self.xy_input_y, width=12).grid(row=1, column=3, sticky="w", padx=4)
-        ttk.Entry(xyz_form, textvariable=self.xy_input_Y, width=12).grid(row=2, column=3, sticky="w", padx=4)
+        ttk.Entry(xyz_form, textvariable=self.xy_input_x, width=12, validate="key", validatecommand=self._vcmd_number).grid(row=0, column=3, sticky="w", padx=4)
+        ttk.Entry(xyz_form, textvariable=self.xy_input_y, width=12, validate="key", validatecommand=self._vcmd_number).grid(row=1, column=3, sticky="w", padx=4)
+        ttk.Entry(xyz_form, textvariable=self.xy_input_Y, width=12, validate="key", validatecommand=self._vcmd_number).grid(row=2, column=3, sticky="w", padx=4)
         ttk.Button(xyz_form, text="xyY -> XYZ", command=self.convert_xyy_to_xyz).grid(row=0, column=4, rowspan=3, padx=8)
 
         ttk.Label(xyz_form, text="White level:").grid(row=3, column=2, sticky="w", padx=12, pady=2)
         self.white_level = tk.StringVar(value="1.0")
-        ttk.Entry(xyz_form, textvariable=self.white_level, width=12).grid(row=3, column=3, sticky="w", padx=4)
+        ttk.Entry(xyz_form, textvariable=self.white_level, width=12, validate="key", validatecommand=self._vcmd_number).grid(row=3, column=3, sticky="w", padx=4)
 
         ttk.Label(self.xyz_frame, text="Chromaticity (derived):").pack(anchor="w", padx=4, pady=(8, 2))
         xy_line = ttk.Frame(self.xyz_frame)
@@ -1053,61 +1522,143 @@ class ICCBuilderApp:
         self.xyz_quick.pack(side="left", padx=6)
         ttk.Button(quick_line, text="Apply", command=self.apply_xyz_quick_fill).pack(side="left")
 
-        ttk.Button(parent, text="Save ICC Profile…", command=self.save_profile).pack(side="right", padx=8, pady=6)
-        self.show_hex_workspace()
+    @contextmanager
+    def _batch_ui(self):
+        # Collapse the header/table/search/editor refreshes requested while replacing the whole
+        # profile into one pass, run once at the end.
+        self._batching = True
+        try:
+            yield
+        finally:
+            self._batching = False
+            pending, self._pending_ui = self._pending_ui, set()
+        self._flush_pending(pending)
+
+    def _flush_pending(self, pending: set):
+        if "header" in pending:
+            self.render_header_fields()
+        if "tags" in pending:
+            self._rebuild_tag_table()
+        if "search" in pending:
+            self.refresh_search_results()
+        if "editor" in pending:
+            self._clear_tag_editor()
+        self.root.update_idletasks()
 
-    def reset_profile(self):
-        self.header_mode = "human"
-        self.header_values_hex = default_header_values_hex()
-        self.render_header_fields()
-        self.tags = [TagEntry(t.signature, t.description, t.data_hex) for t in DEFAULT_TAGS_SAMPLE]
-        self.refresh_tag_table()
-        self.refresh_search_results()
+    def _clear_tag_editor(self):
+        if self._batching:
+            self._pending_ui.add("editor")
+            return
+        self._cancel_hex_render()
         self.hex_text.delete("1.0", tk.END)
         self.tag_title.config(text="Select a tag to edit")
 
+    def reset_profile(self):
+        with self._batch_ui():
+            self.header_mode = "human"
+            self.header_values_hex = default_header_values_hex()
+            self.render_header_fields()
+            self._set_tags(default_tags())
+            self._rebuild_tag_table()
+            self.refresh_search_results()
+            self._clear_tag_editor()
+
+    def _set_tags(self, tags: List[TagEntry]):
+        self.tags = tags
+        # First occurrence wins, matching a linear scan when a loaded profile repeats a signature
+        self._tags_by_sig = {}
+        self._tag_index = {}
+        for i, tag in enumerate(tags):
+            if tag.signature not in self._tags_by_sig:
+                self._tags_by_sig[tag.signature] = tag
+                self._tag_index[tag.signature] = i
+        self._existing_sigs = frozenset(self._tags_by_sig)
+        # Every TRC tag, repeats included; edits to a shared curve are propagated across these
+        self._trc_tags = [tag for tag in tags if tag.signature in ("rTRC", "gTRC", "bTRC")]
+
+    # Coalesce a burst of keystrokes into one filter pass once typing pauses
+    def _schedule_search(self):
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(120, self._run_scheduled_search)
+
+    def _run_scheduled_search(self):
+        self._search_after_id = None
+        self.refresh_search_results()
+
     def refresh_search_results(self):
+        if self._batching:
+            self._pending_ui.add("search")
+            return
         query = self.search_var.get().lower()
-        existing = {t.signature for t in self.tags}
+        existing = self._existing_sigs
+        key = (query, existing)
+        cached = self._search_cache.get(key)
+        if cached is None:
+            last = self._search_last
+            if last is not None and last[1] == existing and query.startswith(last[0]):
+                pool = last[2]
+            else:
+                pool = _SEARCH_ENTRIES
+            if query:
+                entries = [
+                    entry
+                    for entry in pool
+                    if entry[0] not in existing and (query in entry[1] or query in entry[2])
+                ]
+            else:
+                entries = [entry for entry in pool if entry[0] not in existing]
+            cached = (entries, [entry[3] for entry in entries])
+            if len(self._search_cache) >= 64:
+                self._search_cache.pop(next(iter(self._search_cache)))
+            self._search_cache[key] = cached
+        self._search_last = (query, existing, cached[0])
+        rows = cached[1]
+        if rows is self._search_rows_shown:
+            return
+        self._search_rows_shown = rows
         self.search_list.delete(0, tk.END)
-        for sig, desc in sorted(KNOWN_TAG_LIBRARY.items()):
-            if sig in existing:
-                continue
-            if query in sig.lower() or query in desc.lower():
-                self.search_list.insert(tk.END, f"{sig} - {desc}")
+        if rows:
+            self.search_list.insert(tk.END, *rows)
 
     def add_from_search(self):
         selection = self.search_list.get(tk.ACTIVE)
         if not selection:
             return
         sig = selection.split(" - ")[0]
-        if any(t.signature == sig for t in self.tags):
+        if sig in self._tags_by_sig:
             messagebox.showinfo("Tag already present", f"The tag {sig} is already in the table.")
             return
         default_data = "(Add hex for tag here)"
         if sig in KNOWN_TAG_LIBRARY:
             default_data = ""
-        self.tags.append(TagEntry(sig, KNOWN_TAG_LIBRARY.get(sig, "Custom tag"), default_data))
+        self._set_tags(self.tags + [TagEntry(sig, KNOWN_TAG_LIBRARY.get(sig, "Custom tag"), default_data)])
         self.refresh_tag_table(select_signature=sig)
         self.refresh_search_results()
 
     def reorder_tag(self, delta: int):
         if not self.selected_tag:
             return
-        idx = self.tags.index(self.selected_tag)
+        idx = self._tag_index[self.selected_tag.signature]
         new_idx = idx + delta
         if new_idx < 0 or new_idx >= len(self.tags):
             return
-        self.tags[idx], self.tags[new_idx] = self.tags[new_idx], self.tags[idx]
+        moved, other = self.tags[idx], self.tags[new_idx]
+        self.tags[idx], self.tags[new_idx] = other, moved
+        if self._tags_by_sig[moved.signature] is moved:
+            self._tag_index[moved.signature] = new_idx
+        if self._tags_by_sig[other.signature] is other:
+            self._tag_index[other.signature] = idx
         self.refresh_tag_table(select_signature=self.selected_tag.signature)
 
     def remove_tag(self):
         if not self.selected_tag:
             return
-        self.tags = [t for t in self.tags if t is not self.selected_tag]
+        self._set_tags([t for t in self.tags if t is not self.selected_tag])
         self.selected_tag = None
         self.refresh_tag_table()
         self.refresh_search_results()
+        self._cancel_hex_render()
         self.hex_text.delete("1.0", tk.END)
         self.tag_title.config(text="Select a tag to edit")
         self.update_remove_state(None)
@@ -1119,48 +1670,21 @@ class ICCBuilderApp:
             self.update_remove_state(None)
             return
         sig = selection[0]
-        tag = next((t for t in self.tags if t.signature == sig), None)
+        tag = self._tags_by_sig.get(sig)
         if not tag:
             self.update_remove_state(None)
             return
         self.selected_tag = tag
         self.tag_title.config(text=f"Editing {tag.signature} ({tag.description})")
-        if tag.signature in {"cprt", "desc"}:
-            self.mode_toggle_btn.state(["!disabled"])
-            self.workspace_kind = "mluc"
-            self.workspace_mode = "human"
-            self.render_mluc_workspace(tag)
-            self.show_mluc_workspace()
-        elif tag.signature in {"rXYZ", "gXYZ", "bXYZ", "wtpt"}:
-            self.mode_toggle_btn.state(["!disabled"])
-            self.workspace_kind = "xyz"
-            self.workspace_mode = "human"
-            self.render_xyz_workspace(tag)
-            self.show_xyz_workspace()
-        elif tag.signature == "lumi":
-            self.mode_toggle_btn.state(["!disabled"])
-            self.workspace_kind = "lumi"
-            self.workspace_mode = "human"
-            self.render_lumi_workspace(tag)
-            self.show_lumi_workspace()
-        elif tag.signature == "MSCA":
-            self.mode_toggle_btn.state(["!disabled"])
-            self.workspace_kind = "msca"
-            self.workspace_mode = "human"
-            self.render_msca_workspace(tag)
-            self.show_msca_workspace()
-        elif tag.signature == "MHC2":
+        kind = _WORKSPACE_KIND_BY_SIG.get(tag.signature)
+        if kind is not None:
             self.mode_toggle_btn.state(["!disabled"])
-            self.workspace_kind = "mhc2"
+            self.workspace_kind = kind
             self.workspace_mode = "human"
-            self.render_mhc2_workspace(tag)
-            self.show_mhc2_workspace()
-        elif tag.signature in {"rTRC", "gTRC", "bTRC"}:
-            self.mode_toggle_btn.state(["!disabled"])
-            self.workspace_kind = "trc"
-            self.workspace_mode = "human"
-            self.render_trc_workspace(tag)
-            self.show_trc_workspace()
+            self._workspace_renderers[kind](tag)
+            # A renderer that cannot parse the tag has already switched to its hex dump
+            if self.workspace_mode == "human":
+                self._show_human_workspace(kind)
         else:
             self.mode_toggle_btn.state(["disabled"])
             self.workspace_kind = None
@@ -1186,8 +1710,8 @@ class ICCBuilderApp:
             except Exception as exc:
                 messagebox.showerror("Invalid data", str(exc))
                 return
-            self.selected_tag.data_hex = new_bytes.hex().upper()
-            self.render_mluc_workspace(self.selected_tag, refresh_only=True)
+            self.selected_tag.data = new_bytes
+            self.render_mluc_workspace(self.selected_tag)
         elif self.selected_tag.signature in {"rXYZ", "gXYZ", "bXYZ", "wtpt"} and self.workspace_kind == "xyz" and self.workspace_mode == "human":
             try:
                 x = float(self.xyz_x.get())
@@ -1197,7 +1721,7 @@ class ICCBuilderApp:
                 messagebox.showerror("Invalid XYZ", "X, Y, Z must be decimal numbers.")
                 return
             new_bytes = self.build_xyz_bytes(x, y, z)
-            self.selected_tag.data_hex = new_bytes.hex().upper()
+            self.selected_tag.data = new_bytes
             self.render_xyz_workspace(self.selected_tag)
         elif self.selected_tag.signature == "lumi" and self.workspace_kind == "lumi" and self.workspace_mode == "human":
             try:
@@ -1206,17 +1730,12 @@ class ICCBuilderApp:
                 messagebox.showerror("Invalid luminance", "Luminance must be numeric.")
                 return
             new_bytes = self.build_xyz_bytes(val, val, val)
-            self.selected_tag.data_hex = new_bytes.hex().upper()
+            self.selected_tag.data = new_bytes
             self.render_lumi_workspace(self.selected_tag)
         elif self.selected_tag.signature == "MSCA" and self.workspace_kind == "msca" and self.workspace_mode == "human":
             content = self.msca_text.get("1.0", tk.END).rstrip("\n")
             new_bytes = self.build_text_type(content)
-            self.selected_tag.data_hex = new_bytes.hex().upper()
-            self.render_msca_workspace(self.selected_tag)
-        elif self.selected_tag.signature == "MSCA" and self.workspace_kind == "msca" and self.workspace_mode == "human":
-            content = self.msca_text.get("1.0", tk.END).rstrip("\n")
-            new_bytes = self.build_text_type(content)
-            self.selected_tag.data_hex = new_bytes.hex().upper()
+            self.selected_tag.data = new_bytes
             self.render_msca_workspace(self.selected_tag)
         elif self.selected_tag.signature == "MHC2" and self.workspace_kind == "mhc2" and self.workspace_mode == "human":
             try:
@@ -1228,59 +1747,93 @@ class ICCBuilderApp:
                 return
             self.rebuild_mhc2_from_ui(min_nits, peak_nits, entries, status_msg="Updated MHC2.")
         elif self.selected_tag.signature in {"rTRC", "gTRC", "bTRC"} and self.workspace_kind == "trc" and self.workspace_mode == "human":
-            new_bytes = self.build_trc_bytes(self.trc_values)
-            new_hex = new_bytes.hex().upper()
-            self.update_shared_trc_curves(new_hex)
+            self.update_shared_trc_curves(self.build_trc_bytes(self.trc_values))
             self.render_trc_workspace(self.selected_tag)
         else:
+            self._flush_hex_view()
             content = self.hex_text.get("1.0", tk.END)
             try:
                 new_bytes = self.parse_hex_view(content)
             except Exception as exc:
                 messagebox.showerror("Invalid hex", str(exc))
                 return
-            self.selected_tag.data_hex = new_bytes.hex().upper()
+            self.selected_tag.data = new_bytes
         self.refresh_tag_table(select_signature=self.selected_tag.signature)
 
     def render_hex_view(self, data: bytes):
-        header_groups = [" ".join([f"{x:02X}" for x in range(g, g + 4)]) for g in range(0x0, 0x10, 4)]
-        header = "  ".join(header_groups)
-        self.hex_header.config(text=header)
-
-        offset_lines = []
-        hex_lines = []
-        for i in range(0, len(data), 16):
-            chunk = data[i : i + 16]
-            hex_pairs = [f"{b:02X}" for b in chunk]
-            grouped = []
-            for g in range(0, len(hex_pairs), 4):
-                grouped.append(" ".join(hex_pairs[g : g + 4]))
-            hex_str = "  ".join(grouped)
-            offset_lines.append(f"{i:04X}")
-            hex_lines.append(hex_str)
-
-        offset_display = "\n".join(offset_lines)
-        hex_display = "\n".join(hex_lines)
-
-        self.offset_text.configure(state="normal")
-        self.offset_text.delete("1.0", tk.END)
-        self.offset_text.insert(tk.END, offset_display)
-        self.offset_text.configure(state="disabled")
-
-        self.hex_text.configure(state="normal")
-        self.hex_text.delete("1.0", tk.END)
-        self.hex_text.insert(tk.END, hex_display)
+        # Large payloads are formatted and inserted in slices from idle callbacks, so the first
+        # screenful shows up immediately; readers of hex_text call _flush_hex_view first.
+        self._cancel_hex_render()
+        line_count = (len(data) + 15) // 16
+        first = min(_HEX_VIEW_CHUNK_LINES, line_count)
+        offset_lines, hex_lines = hex_view_lines(data, 0, first)
+        self._write_readonly_text(self.offset_text, "\n".join(offset_lines))
+        # The hex pane starts disabled and becomes editable once a tag is shown
         self.hex_text.configure(state="normal")
+        self.hex_text.replace("1.0", tk.END, "\n".join(hex_lines))
+
+        if line_count > first:
+            self._hex_pending = [data, first]
+            self._hex_render_job = self.root.after_idle(self._render_hex_chunk)
+
+    def _append_hex_lines(self, data: bytes, start: int, end: int):
+        offset_lines, hex_lines = hex_view_lines(data, start, end)
+        self._write_readonly_text(self.offset_text, "\n" + "\n".join(offset_lines), append=True)
+        self.hex_text.insert(tk.END, "\n" + "\n".join(hex_lines))
+
+    @staticmethod
+    def _write_readonly_text(widget: tk.Text, text: str, append: bool = False):
+        # One state flip and one Text operation per write; the hex pane itself stays editable
+        widget.configure(state="normal")
+        if append:
+            widget.insert(tk.END, text)
+        else:
+            widget.replace("1.0", tk.END, text)
+        widget.configure(state="disabled")
+
+    def _render_hex_chunk(self):
+        self._hex_render_job = None
+        if self._hex_pending is None:
+            return
+        data, start = self._hex_pending
+        end = start + _HEX_VIEW_CHUNK_LINES
+        self._append_hex_lines(data, start, end)
+        if end * 16 < len(data):
+            self._hex_pending[1] = end
+            self._hex_render_job = self.root.after_idle(self._render_hex_chunk)
+        else:
+            self._hex_pending = None
+
+    def _flush_hex_view(self):
+        if self._hex_pending is None:
+            return
+        data, start = self._hex_pending
+        self._cancel_hex_render()
+        self._append_hex_lines(data, start, (len(data) + 15) // 16)
+
+    def _cancel_hex_render(self):
+        if self._hex_render_job is not None:
+            self.root.after_cancel(self._hex_render_job)
+            self._hex_render_job = None
+        self._hex_pending = None
 
     def parse_hex_view(self, content: str) -> bytes:
-        data_bytes = bytearray()
-        for line in content.strip().splitlines():
-            hex_parts = line.strip().split()
-            for part in hex_parts:
-                if len(part) != 2:
-                    continue
-                data_bytes.append(int(part, 16))
-        return bytes(data_bytes)
+        # Fast path: a well-formed view is whitespace-separated byte pairs, which bytes.fromhex
+        # parses in C. One token per byte means no longer tokens were merged that would be skipped.
+        try:
+            data = bytes.fromhex(content)
+        except ValueError:
+            pass
+        else:
+            if len(data) == len(content.split()):
+                return data
+        # Otherwise keep only the two-character tokens (stray fragments are ignored) and decode them in one go
+        pairs = "".join(part for part in content.split() if len(part) == 2)
+        try:
+            return bytes.fromhex(pairs)
+        except ValueError:
+            bad = next(part for part in content.split() if len(part) == 2 and not _HEX_PAIR_RE.fullmatch(part))
+            raise ValueError(f"Invalid hex byte '{bad}'") from None
 
     def _sync_scroll(self, *args):
         self.hex_text.yview(*args)
@@ -1291,125 +1844,49 @@ class ICCBuilderApp:
             self.offset_text.yview_moveto(pos)
             self.hex_text.yview_moveto(pos)
 
+    def _pack_workspace(self, kind: str):
+        frame = self._ensure_workspace(kind)
+        if self._active_workspace_frame is frame:
+            return
+        if self._active_workspace_frame is not None:
+            self._active_workspace_frame.pack_forget()
+        frame.pack(fill="both", expand=True)
+        self._active_workspace_frame = frame
+
     def show_hex_workspace(self):
-        self.mluc_frame.pack_forget()
-        self.xyz_frame.pack_forget()
-        self.lumi_frame.pack_forget()
-        self.msca_frame.pack_forget()
-        self.mhc2_frame.pack_forget()
-        self.trc_frame.pack_forget()
-        self.hex_frame.pack(fill="both", expand=True)
+        self._pack_workspace("hex")
         self.workspace_mode = "hex"
         if self.workspace_kind in {"mluc", "xyz"}:
             self.mode_toggle_btn.config(text="Switch to Human")
         else:
             self.mode_toggle_btn.config(text="Human/Hex")
 
-    def show_mluc_workspace(self):
-        self.hex_frame.pack_forget()
-        self.xyz_frame.pack_forget()
-        self.lumi_frame.pack_forget()
-        self.msca_frame.pack_forget()
-        self.mhc2_frame.pack_forget()
-        self.trc_frame.pack_forget()
-        self.mluc_frame.pack(fill="both", expand=True)
-        self.workspace_mode = "human"
-        self.workspace_kind = "mluc"
-        self.mode_toggle_btn.config(text="Switch to Hex")
-
-    def show_xyz_workspace(self):
-        self.hex_frame.pack_forget()
-        self.mluc_frame.pack_forget()
-        self.lumi_frame.pack_forget()
-        self.msca_frame.pack_forget()
-        self.mhc2_frame.pack_forget()
-        self.trc_frame.pack_forget()
-        self.xyz_frame.pack(fill="both", expand=True)
+    def _show_human_workspace(self, kind: str):
+        self._pack_workspace(kind)
         self.workspace_mode = "human"
-        self.workspace_kind = "xyz"
-        self.mode_toggle_btn.config(text="Switch to Hex")
-
-    def show_lumi_workspace(self):
-        self.hex_frame.pack_forget()
-        self.mluc_frame.pack_forget()
-        self.xyz_frame.pack_forget()
-        self.msca_frame.pack_forget()
-        self.mhc2_frame.pack_forget()
-        self.trc_frame.pack_forget()
-        self.lumi_frame.pack(fill="both", expand=True)
-        self.workspace_mode = "human"
-        self.workspace_kind = "lumi"
-        self.mode_toggle_btn.config(text="Switch to Hex")
-
-    def show_msca_workspace(self):
-        self.hex_frame.pack_forget()
-        self.mluc_frame.pack_forget()
-        self.xyz_frame.pack_forget()
-        self.lumi_frame.pack_forget()
-        self.mhc2_frame.pack_forget()
-        self.msca_frame.pack(fill="both", expand=True)
-        self.workspace_mode = "human"
-        self.workspace_kind = "msca"
-        self.mode_toggle_btn.config(text="Switch to Hex")
-
-    def show_trc_workspace(self):
-        self.hex_frame.pack_forget()
-        self.mluc_frame.pack_forget()
-        self.xyz_frame.pack_forget()
-        self.lumi_frame.pack_forget()
-        self.msca_frame.pack_forget()
-        self.mhc2_frame.pack_forget()
-        self.trc_frame.pack(fill="both", expand=True)
-        self.workspace_mode = "human"
-        self.workspace_kind = "trc"
-        self.mode_toggle_btn.config(text="Switch to Hex")
-
-    def show_mhc2_workspace(self):
-        self.hex_frame.pack_forget()
-        self.mluc_frame.pack_forget()
-        self.xyz_frame.pack_forget()
-        self.lumi_frame.pack_forget()
-        self.msca_frame.pack_forget()
-        self.trc_frame.pack_forget()
-        self.mhc2_frame.pack(fill="both", expand=True)
-        self.workspace_mode = "human"
-        self.workspace_kind = "mhc2"
+        self.workspace_kind = kind
         self.mode_toggle_btn.config(text="Switch to Hex")
 
     def toggle_workspace_mode(self):
-        if not self.selected_tag or self.workspace_kind not in {"mluc", "xyz", "lumi", "msca", "trc", "mhc2"}:
+        render = self._workspace_renderers.get(self.workspace_kind)
+        if not self.selected_tag or render is None:
             return
         if self.workspace_mode == "human":
             self.show_hex_workspace()
             self.render_hex_view(self.selected_tag.data_bytes())
         else:
-            if self.workspace_kind == "mluc":
-                self.show_mluc_workspace()
-                self.render_mluc_workspace(self.selected_tag)
-            elif self.workspace_kind == "xyz":
-                self.show_xyz_workspace()
-                self.render_xyz_workspace(self.selected_tag)
-            elif self.workspace_kind == "lumi":
-                self.show_lumi_workspace()
-                self.render_lumi_workspace(self.selected_tag)
-            elif self.workspace_kind == "msca":
-                self.show_msca_workspace()
-                self.render_msca_workspace(self.selected_tag)
-            elif self.workspace_kind == "mhc2":
-                self.show_mhc2_workspace()
-                self.render_mhc2_workspace(self.selected_tag)
-            elif self.workspace_kind == "trc":
-                self.show_trc_workspace()
-                self.render_trc_workspace(self.selected_tag)
+            self._show_human_workspace(self.workspace_kind)
+            render(self.selected_tag)
 
     def apply_identity_chad(self):
         if not self.selected_tag or self.selected_tag.signature != "chad":
             return
-        self.selected_tag.data_hex = chad_identity_bytes().hex().upper()
+        self.selected_tag.data = chad_identity_bytes()
         self.render_hex_view(self.selected_tag.data_bytes())
         self.refresh_tag_table(select_signature="chad")
 
-    def render_mluc_workspace(self, tag: TagEntry, refresh_only: bool = False):
+    def render_mluc_workspace(self, tag: TagEntry):
+        self._ensure_workspace("mluc")
         try:
             records = self.parse_mluc(tag.data_bytes())
         except Exception as exc:
@@ -1418,14 +1895,12 @@ class ICCBuilderApp:
             self.render_hex_view(tag.data_bytes())
             return
         self.mluc_records = records
-        if refresh_only:
-            layout = self.compute_mluc_layout(self.mluc_records)
-        else:
-            layout = None
-        self.mluc_combo["values"] = [f"Record {i+1}: {r['lang']}-{r['country']}" for i, r in enumerate(self.mluc_records)]
+        self._mluc_layout_version += 1
+        self._mluc_combo_strings = [self._mluc_record_label(i, r) for i, r in enumerate(records)]
+        self.mluc_combo["values"] = self._mluc_combo_strings
         if self.mluc_records:
             self.mluc_combo.current(0)
-            self.load_mluc_record(0, layout)
+            self.load_mluc_record(0)
         else:
             self.mluc_combo.set("")
             self.mluc_total.config(text="Records: 0")
@@ -1436,13 +1911,22 @@ class ICCBuilderApp:
             self.mluc_offset_info.config(text="")
             self.mluc_text.delete("1.0", tk.END)
 
-    def load_mluc_record(self, idx: int, layout=None):
+    @staticmethod
+    def _mluc_record_label(idx: int, rec: Dict[str, str]) -> str:
+        return f"Record {idx+1}: {rec['lang']}-{rec['country']}"
+
+    def _get_mluc_layout(self) -> List[Dict[str, int]]:
+        cached = self._mluc_layout_cache
+        if cached is None or cached[0] != self._mluc_layout_version:
+            cached = (self._mluc_layout_version, self.compute_mluc_layout(self.mluc_records))
+            self._mluc_layout_cache = cached
+        return cached[1]
+
+    def load_mluc_record(self, idx: int):
         if idx < 0 or idx >= len(self.mluc_records):
             return
         rec = self.mluc_records[idx]
-        if layout is None:
-            layout = self.compute_mluc_layout(self.mluc_records)
-        meta = layout[idx]
+        meta = self._get_mluc_layout()[idx]
         self.mluc_total.config(text=f"Records: {len(self.mluc_records)}")
         self.mluc_index_label.config(text=f"Index: {idx+1}")
         self.mluc_lang.set(rec["lang"])
@@ -1451,8 +1935,7 @@ class ICCBuilderApp:
         self.mluc_country_info.config(text=f"{rec['country'].encode().hex().upper()}")
         self.mluc_length_info.config(text=f"{meta['length']} (0x{meta['length']:X})")
         self.mluc_offset_info.config(text=f"{meta['offset']} (0x{meta['offset']:X})")
-        self.mluc_text.delete("1.0", tk.END)
-        self.mluc_text.insert(tk.END, rec["text"])
+        self.mluc_text.replace("1.0", tk.END, rec["text"])
 
     def on_mluc_selected(self):
         if not hasattr(self, "mluc_records"):
@@ -1460,17 +1943,17 @@ class ICCBuilderApp:
         sel = self.mluc_combo.current()
         if sel < 0:
             return
-        layout = self.compute_mluc_layout(self.mluc_records)
-        self.load_mluc_record(sel, layout)
+        self.load_mluc_record(sel)
 
     def add_mluc_record(self):
         if not hasattr(self, "mluc_records"):
             self.mluc_records = []
         self.mluc_records.append({"lang": "en", "country": "US", "text": ""})
-        self.mluc_combo["values"] = [f"Record {i+1}: {r['lang']}-{r['country']}" for i, r in enumerate(self.mluc_records)]
+        self._mluc_layout_version += 1
+        self._mluc_combo_strings.append(self._mluc_record_label(len(self.mluc_records) - 1, self.mluc_records[-1]))
+        self.mluc_combo["values"] = self._mluc_combo_strings
         self.mluc_combo.current(len(self.mluc_records) - 1)
-        layout = self.compute_mluc_layout(self.mluc_records)
-        self.load_mluc_record(len(self.mluc_records) - 1, layout)
+        self.load_mluc_record(len(self.mluc_records) - 1)
 
     def update_mluc_record_from_ui(self):
         sel = self.mluc_combo.current()
@@ -1483,9 +1966,15 @@ class ICCBuilderApp:
         self.mluc_records[sel]["lang"] = lang
         self.mluc_records[sel]["country"] = country
         self.mluc_records[sel]["text"] = self.mluc_text.get("1.0", tk.END).rstrip("\n")
-        self.mluc_combo["values"] = [f"Record {i+1}: {r['lang']}-{r['country']}" for i, r in enumerate(self.mluc_records)]
+        self._mluc_layout_version += 1
+        # Only a changed language/country alters the record's label
+        label = self._mluc_record_label(sel, self.mluc_records[sel])
+        if label != self._mluc_combo_strings[sel]:
+            self._mluc_combo_strings[sel] = label
+            self.mluc_combo["values"] = self._mluc_combo_strings
 
     def render_xyz_workspace(self, tag: TagEntry):
+        self._ensure_workspace("xyz")
         try:
             x, y, z = self.parse_xyz(tag.data_bytes())
         except Exception as exc:
@@ -1501,6 +1990,7 @@ class ICCBuilderApp:
         self.load_xyz_quick_options(tag.signature)
 
     def render_lumi_workspace(self, tag: TagEntry):
+        self._ensure_workspace("lumi")
         try:
             x, y, z = self.parse_xyz(tag.data_bytes())
         except Exception as exc:
@@ -1512,6 +2002,7 @@ class ICCBuilderApp:
         self.lumi_xyz_label.config(text=f"XYZ = {x:.6f}, {y:.6f}, {z:.6f}")
 
     def render_msca_workspace(self, tag: TagEntry):
+        self._ensure_workspace("msca")
         try:
             text = self.parse_text_type(tag.data_bytes())
         except Exception as exc:
@@ -1519,10 +2010,10 @@ class ICCBuilderApp:
             self.show_hex_workspace()
             self.render_hex_view(tag.data_bytes())
             return
-        self.msca_text.delete("1.0", tk.END)
-        self.msca_text.insert(tk.END, text)
+        self.msca_text.replace("1.0", tk.END, text)
 
     def render_mhc2_workspace(self, tag: TagEntry, status: str | None = None, popup: bool = True):
+        self._ensure_workspace("mhc2")
         try:
             parsed = self.parse_mhc2(tag.data_bytes())
         except Exception as exc:
@@ -1530,25 +2021,25 @@ class ICCBuilderApp:
             self.show_hex_workspace()
             self.render_hex_view(tag.data_bytes())
             return
-        self.mhc2_min.set(f"{parsed['min_nits']:.4f}")
-        self.mhc2_peak.set(f"{parsed['peak_nits']:.4f}")
-        self.mhc2_matrix_off.set(f"{parsed['matrix_off']} (0x{parsed['matrix_off']:X})")
-        self.mhc2_lut_r.set(f"{parsed['lut_r_off']} (0x{parsed['lut_r_off']:X})")
-        self.mhc2_lut_g.set(f"{parsed['lut_g_off']} (0x{parsed['lut_g_off']:X})")
-        self.mhc2_lut_b.set(f"{parsed['lut_b_off']} (0x{parsed['lut_b_off']:X})")
-        self.mhc2_entries.set(str(parsed["lut_entries"]))
-        self.mhc2_max_full.set(parsed["max_full_lumi"])
+        # Re-rendering after an apply mostly reproduces the same texts; unchanged fields are left alone
+        self._set_var_text(self.mhc2_min, f"{parsed['min_nits']:.4f}")
+        self._set_var_text(self.mhc2_peak, f"{parsed['peak_nits']:.4f}")
+        self._set_var_text(self.mhc2_matrix_off, f"{parsed['matrix_off']} (0x{parsed['matrix_off']:X})")
+        self._set_var_text(self.mhc2_lut_r, f"{parsed['lut_r_off']} (0x{parsed['lut_r_off']:X})")
+        self._set_var_text(self.mhc2_lut_g, f"{parsed['lut_g_off']} (0x{parsed['lut_g_off']:X})")
+        self._set_var_text(self.mhc2_lut_b, f"{parsed['lut_b_off']} (0x{parsed['lut_b_off']:X})")
+        self._set_var_text(self.mhc2_entries, str(parsed["lut_entries"]))
+        self._set_var_text(self.mhc2_max_full, parsed["max_full_lumi"])
         # populate matrix fields
         matrix_vals = parsed.get("matrix") or identity_matrix12()
-        for idx, val in enumerate(matrix_vals):
-            r, c = divmod(idx, 4)
-            self.mhc2_matrix_vars[r][c].set(f"{val:.6f}")
+        self.set_mhc2_matrix(matrix_vals)
         self.mhc2_lut_values = parsed.get("lut_values", None)
         self.update_mhc2_lut_preview(parsed.get("lut_values"), parsed.get("lut_entries", 0))
         if popup and status is not None and status:
             messagebox.showinfo("MHC2", status)
 
     def render_trc_workspace(self, tag: TagEntry):
+        self._ensure_workspace("trc")
         try:
             info = self.parse_trc(tag.data_bytes())
         except Exception as exc:
@@ -1557,7 +2048,7 @@ class ICCBuilderApp:
             self.render_hex_view(tag.data_bytes())
             return
         self.trc_values = info["values"]
-        self.trc_source_hex = tag.data_hex
+        self.trc_source_bytes = tag.data_bytes()
         if info["gamma"] is not None:
             self.trc_gamma_combo.set("")  # show only user selection
             self.trc_info.config(text=f"TRC: entry count=1 (Gamma={info['gamma']:.1f})")
@@ -1576,23 +2067,22 @@ class ICCBuilderApp:
         self.xyz_x_chroma.config(text=f"{x_chroma:.6f}")
         self.xyz_y_chroma.config(text=f"{y_chroma:.6f}")
 
-    def update_shared_trc_curves(self, new_hex: str):
-        original = getattr(self, "trc_source_hex", None) or (self.selected_tag.data_hex if self.selected_tag else None)
-        for tag in self.tags:
-            if tag.signature in {"rTRC", "gTRC", "bTRC"}:
-                if original is None or tag.data_hex == original:
-                    tag.data_hex = new_hex
+    def update_shared_trc_curves(self, new_bytes: bytes):
+        original = getattr(self, "trc_source_bytes", None) or (self.selected_tag.data_bytes() if self.selected_tag else None)
+        for tag in self._trc_tags:
+            if original is None or tag.data_bytes() == original:
+                tag.data = new_bytes
         if self.selected_tag:
-            self.trc_source_hex = new_hex
+            self.trc_source_bytes = new_bytes
 
     def parse_xyz(self, data: bytes):
         if len(data) < 20 or data[:4] != b"XYZ ":
             raise ValueError("Not an XYZ type tag")
-        sig, x_raw, y_raw, z_raw = struct.unpack(">4s4xiii", data[:20])
-        return (from_s15fixed16(x_raw), from_s15fixed16(y_raw), from_s15fixed16(z_raw))
+        _sig, x_raw, y_raw, z_raw = _XYZ_TAG_STRUCT.unpack_from(data)
+        return (x_raw / 65536.0, y_raw / 65536.0, z_raw / 65536.0)
 
     def build_xyz_bytes(self, x: float, y: float, z: float) -> bytes:
-        return struct.pack(">4s4xiii", b"XYZ ", to_s15fixed16(x), to_s15fixed16(y), to_s15fixed16(z))
+        return _XYZ_TAG_STRUCT.pack(b"XYZ ", to_s15fixed16(x), to_s15fixed16(y), to_s15fixed16(z))
 
     def parse_text_type(self, data: bytes) -> str:
         if len(data) < 8 or data[:4] != b"text":
@@ -1601,46 +2091,34 @@ class ICCBuilderApp:
 
     def build_text_type(self, content: str) -> bytes:
         payload = content.encode("ascii", errors="replace")
-        blob = b"text" + b"\x00" * 4 + payload
-        while len(blob) % 4:
-            blob += b"\x00"
-        return blob
+        return b"text\x00\x00\x00\x00" + payload + b"\x00" * (-len(payload) & 3)
 
     def parse_mhc2(self, data: bytes):
         if len(data) < 36 or data[:4] != b"MHC2":
             raise ValueError("Not an MHC2 tag")
-        sig, reserved = struct.unpack_from(">4sI", data, 0)
-        count = struct.unpack_from(">I", data, 8)[0]
-        min_raw = struct.unpack_from(">i", data, 12)[0]
-        peak_raw = struct.unpack_from(">i", data, 16)[0]
-        matrix_off = struct.unpack_from(">I", data, 20)[0]
-        lut_r = struct.unpack_from(">I", data, 24)[0]
-        lut_g = struct.unpack_from(">I", data, 28)[0]
-        lut_b = struct.unpack_from(">I", data, 32)[0]
+        _sig, count, min_raw, peak_raw, matrix_off, lut_r, lut_g, lut_b = _MHC2_HEADER_STRUCT.unpack_from(data)
         min_nits = from_s15fixed16(min_raw)
         peak_nits = from_s15fixed16(peak_raw)
 
+        # Sub-blocks are decoded through a memoryview so numpy reads them in place, without slice copies
+        view = memoryview(data)
         matrix_vals = None
         # Matrix is 12 s15Fixed16 numbers (3x4) without a type signature
         if matrix_off and matrix_off + 48 <= len(data):
-            m_data = data[matrix_off : matrix_off + 48]
-            vals = struct.unpack(">" + "i" * 12, m_data)
-            matrix_vals = [from_s15fixed16(v) for v in vals]
+            matrix_vals = s15fixed16_bytes_to_float(view[matrix_off : matrix_off + 48]).tolist()
 
         lut_values = None
         if count > 0:
             lut_values = []
             for off in (lut_r, lut_g, lut_b):
-                if off and off + 8 + count * 4 <= len(data) and data[off : off + 4] == b"sf32":
-                    raw = data[off + 8 : off + 8 + count * 4]
-                    vals = struct.unpack(">" + "i" * count, raw)
-                    lut_values.append([from_s15fixed16(v) for v in vals])
+                if off and off + 8 + count * 4 <= len(data) and data.startswith(b"sf32", off):
+                    lut_values.append(s15fixed16_bytes_to_float(view[off + 8 : off + 8 + count * 4]).tolist())
                 else:
                     lut_values.append([])
 
         # derive max full frame from lumi tag
         max_full = "-"
-        lumi_tag = next((t for t in self.tags if t.signature == "lumi"), None)
+        lumi_tag = self._tags_by_sig.get("lumi")
         if lumi_tag:
             try:
                 _, y, _ = self.parse_xyz(lumi_tag.data_bytes())
@@ -1666,15 +2144,7 @@ class ICCBuilderApp:
         count = max(0, lut_entries)
 
         # Build matrix block (12 s15Fixed16 values, no signature)
-        matrix_vals = []
-        for r in range(3):
-            for c in range(4):
-                try:
-                    v = float(self.mhc2_matrix_vars[r][c].get())
-                except Exception:
-                    v = 0.0
-                matrix_vals.append(to_s15fixed16(v))
-        matrix_block = struct.pack(">" + "i" * 12, *matrix_vals)
+        matrix_block = float_to_s15fixed16_bytes(self.get_mhc2_matrix())
 
         # Build LUT blocks
         lut_blocks = []
@@ -1682,21 +2152,22 @@ class ICCBuilderApp:
             lut_lists = self.mhc2_lut_values if getattr(self, "mhc2_lut_values", None) else None
             if not lut_lists or len(lut_lists) != 3 or any(len(ch) != count for ch in lut_lists):
                 # identity default
-                lut_lists = [[i / (count - 1 if count > 1 else 1) for i in range(count)] for _ in range(3)]
-            for ch_vals in lut_lists:
-                ints = [to_s15fixed16(v) for v in ch_vals]
-                lut_blocks.append(b"sf32" + b"\x00" * 4 + struct.pack(">" + "i" * count, *ints))
-
-        # Compute offsets (all relative to start of MHC2 structure)
-        matrix_off_new = 36
-        lut_r_off_new = matrix_off_new + len(matrix_block) if count > 0 else 0
-        lut_g_off_new = lut_r_off_new + (len(lut_blocks[0]) if count > 0 else 0) if count > 0 else 0
-        lut_b_off_new = lut_g_off_new + (len(lut_blocks[1]) if count > 0 else 0) if count > 0 else 0
-
-        header = struct.pack(
-            ">4sI I i i I I I I",
+                lut_blocks = [identity_lut_block(count)] * 3
+            else:
+                for ch_vals in lut_lists:
+                    lut_blocks.append(b"sf32" + b"\x00" * 4 + float_to_s15fixed16_bytes(ch_vals))
+
+        # Compute offsets (all relative to start of MHC2 structure); each LUT block is sf32 + reserved + count values
+        matrix_off_new = _MHC2_HEADER_STRUCT.size
+        if count > 0:
+            lut_r_off_new = matrix_off_new + len(matrix_block)
+            lut_g_off_new = lut_r_off_new + 8 + count * 4
+            lut_b_off_new = lut_g_off_new + 8 + count * 4
+        else:
+            lut_r_off_new = lut_g_off_new = lut_b_off_new = 0
+
+        header = _MHC2_HEADER_STRUCT.pack(
             b"MHC2",
-            0,
             count,
             to_s15fixed16(min_nits),
             to_s15fixed16(peak_nits),
@@ -1706,60 +2177,50 @@ class ICCBuilderApp:
             lut_b_off_new,
         )
 
-        body = bytearray()
-        body.extend(matrix_block)
-        for block in lut_blocks:
-            body.extend(block)
-        return header + body
+        # join sizes the result up front and copies each block once
+        return b"".join((header, matrix_block, *lut_blocks))
+
+    @staticmethod
+    def _set_var_text(var: tk.StringVar, text: str):
+        # Skip the Tcl round trip (and any write traces) when the variable already shows this text
+        if var.get() != text:
+            var.set(text)
+
+    def set_mhc2_matrix(self, values: List[float]):
+        for var, val in zip(self.mhc2_matrix_vars, values):
+            self._set_var_text(var, f"{val:.6f}")
+
+    # Matrix cells as floats; a blank or malformed cell counts as 0.0
+    def get_mhc2_matrix(self) -> List[float]:
+        values = []
+        for var in self.mhc2_matrix_vars:
+            try:
+                values.append(float(var.get()))
+            except ValueError:
+                values.append(0.0)
+        return values
 
     def update_mhc2_lut_preview(self, lut_values, count: int):
         # rows: first five, ellipsis, last five
-        for r in range(11):
-            for c in range(3):
-                self.mhc2_preview_vars[r][c].set("")
-            self.mhc2_preview_idx_vars[r].set("")
-        if not lut_values or count <= 0:
-            return
-        if count <= 5:
-            rows_to_fill = count
-            for r in range(rows_to_fill):
-                self.mhc2_preview_idx_vars[r].set(f"{r}")
-                for c in range(3):
-                    try:
-                        val = lut_values[c][r]
-                        self.mhc2_preview_vars[r][c].set(f"{val:.6f}")
-                    except Exception:
-                        self.mhc2_preview_vars[r][c].set("")
-            return
+        channels = (list(lut_values) + [[], [], []])[:3] if lut_values else [[], [], []]
 
-        # first five
-        for r in range(5):
-            self.mhc2_preview_idx_vars[r].set(f"{r}")
-            for c in range(3):
-                try:
-                    val = lut_values[c][r]
-                    self.mhc2_preview_vars[r][c].set(f"{val:.6f}")
-                except Exception:
-                    self.mhc2_preview_vars[r][c].set("")
-        # ellipsis row
-        self.mhc2_preview_idx_vars[5].set("...")
-        for c in range(3):
-            self.mhc2_preview_vars[5][c].set("...")
-
-        # last five
-        start_last = max(count - 5, 0)
-        rows_idx = 6
-        for idx in range(start_last, start_last + 5):
-            if idx >= count:
-                break
-            self.mhc2_preview_idx_vars[rows_idx].set(f"{idx}")
-            for c in range(3):
-                try:
-                    val = lut_values[c][idx]
-                    self.mhc2_preview_vars[rows_idx][c].set(f"{val:.6f}")
-                except Exception:
-                    self.mhc2_preview_vars[rows_idx][c].set("")
-            rows_idx += 1
+        def row(idx: int) -> Tuple[str, str, str, str]:
+            return (f"{idx}", *(f"{ch[idx]:.6f}" if idx < len(ch) else "" for ch in channels))
+
+        rows: List[Tuple[str, str, str, str]] = []
+        if lut_values and count > 0:
+            if count <= 5:
+                rows = [row(r) for r in range(count)]
+            else:
+                rows = [row(r) for r in range(5)]
+                rows.append(("...", "...", "...", "..."))
+                rows += [row(idx) for idx in range(max(count - 5, 0), count)]
+        rows += [("", "", "", "")] * (11 - len(rows))
+
+        for r, (idx_text, *cells) in enumerate(rows):
+            self._set_var_text(self.mhc2_preview_idx_vars[r], idx_text)
+            for var, text in zip(self.mhc2_preview_vars[r], cells):
+                self._set_var_text(var, text)
 
     def rebuild_mhc2_from_ui(self, min_nits: float, peak_nits: float, entries: int, status_msg: str = "Updated MHC2.", popup: bool = True):
         if not self.selected_tag or self.selected_tag.signature != "MHC2":
@@ -1769,7 +2230,7 @@ class ICCBuilderApp:
         except Exception as exc:
             messagebox.showerror("Invalid MHC2", f"Failed to rebuild MHC2:\n{exc}")
             return
-        self.selected_tag.data_hex = new_bytes.hex().upper()
+        self.selected_tag.data = new_bytes
         # Refresh UI and offsets with the rebuilt data
         self.render_mhc2_workspace(self.selected_tag, status=status_msg, popup=popup)
         self.refresh_tag_table(select_signature="MHC2")
@@ -1779,17 +2240,12 @@ class ICCBuilderApp:
     def parse_trc(self, data: bytes):
         if len(data) < 12 or data[:4] != b"curv":
             raise ValueError("Not a curveType")
-        count = struct.unpack(">I", data[8:12])[0]
+        _sig, count = _CURV_HEADER_STRUCT.unpack_from(data)
         if count == 0:
             raise ValueError("TRC count cannot be zero")
-        values = []
-        offset = 12
-        for _ in range(count):
-            if offset + 2 > len(data):
-                raise ValueError("TRC data truncated")
-            val = struct.unpack(">H", data[offset : offset + 2])[0]
-            values.append(val)
-            offset += 2
+        if 12 + count * 2 > len(data):
+            raise ValueError("TRC data truncated")
+        values = np.frombuffer(data, dtype=">u2", count=count, offset=12).tolist()
         gamma = values[0] / 256.0 if count == 1 else None
         return {"values": values, "gamma": gamma}
 
@@ -1798,11 +2254,10 @@ class ICCBuilderApp:
         # Special case: gamma encoded as u8Fixed8 with count=1, followed by two zero bytes to align to 4-byte count field
         if count == 1:
             gamma_fixed = max(0, min(65535, int(values[0])))
-            return struct.pack(">4s4xI", b"curv", 1) + struct.pack(">H", gamma_fixed) + b"\x00\x00"
-        blob = struct.pack(">4s4xI", b"curv", count)
-        for v in values:
-            blob += struct.pack(">H", max(0, min(65535, int(v))))
-        return blob
+            return _CURV_HEADER_STRUCT.pack(b"curv", 1) + gamma_fixed.to_bytes(2, "big") + b"\x00\x00"
+        # float64 holds every u16 exactly; the cast truncates like int() did
+        entries = np.clip(np.asarray(values, dtype=np.float64), 0, 65535).astype(">u2")
+        return _CURV_HEADER_STRUCT.pack(b"curv", count) + entries.tobytes()
 
     def load_mhc2_matrix_csv(self):
         path = filedialog.askopenfilename(
@@ -1812,12 +2267,11 @@ class ICCBuilderApp:
         if not path:
             return
         try:
-            import csv
             with open(path, "r", encoding="utf-8-sig", newline="") as f:
                 data = f.read()
             sample = data[:2048]
             try:
-                dialect = csv.Sniffer().sniff(sample, delimiters=",;\\t")
+                dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
             except Exception:
                 dialect = csv.excel
             rows = list(csv.reader(io.StringIO(data), dialect))
@@ -1829,12 +2283,7 @@ class ICCBuilderApp:
                         flat.append(float(cell))
             if len(flat) < 12:
                 raise ValueError("Need 12 numeric values for 3x4 matrix.")
-            flat = flat[:12]
-            idx = 0
-            for r in range(3):
-                for c in range(4):
-                    self.mhc2_matrix_vars[r][c].set(f"{flat[idx]:.6f}")
-                    idx += 1
+            self.set_mhc2_matrix(flat[:12])
             # rebuild tag to reflect new matrix
             try:
                 min_nits = float(self.mhc2_min.get() or 0)
@@ -1848,12 +2297,7 @@ class ICCBuilderApp:
             messagebox.showerror("Load failed", f"Could not load matrix:\n{exc}")
 
     def apply_mhc2_identity_matrix(self):
-        vals = identity_matrix12()
-        idx = 0
-        for r in range(3):
-            for c in range(4):
-                self.mhc2_matrix_vars[r][c].set(f"{vals[idx]:.6f}")
-                idx += 1
+        self.set_mhc2_matrix(identity_matrix12())
         self.rebuild_mhc2_from_ui(
             float(self.mhc2_min.get() or 0),
             float(self.mhc2_peak.get() or 0),
@@ -1869,32 +2313,20 @@ class ICCBuilderApp:
         if not path:
             return
         try:
-            import csv
-
-            rows = []
             with open(path, "r", encoding="utf-8-sig", newline="") as f:
                 data = f.read()
             sample = data[:2048]
             try:
-                dialect = csv.Sniffer().sniff(sample, delimiters=",;\\t")
+                dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
             except Exception:
                 dialect = csv.excel
-            reader = csv.reader(io.StringIO(data), dialect)
-            for row in reader:
-                if not row:
-                    continue
-                rows.append(row)
-            values_r, values_g, values_b = [], [], []
-            for row in rows:
-                if len(row) < 3:
-                    continue
-                values_r.append(float(row[0]))
-                values_g.append(float(row[1]))
-                values_b.append(float(row[2]))
-            n = len(values_r)
+            # The first three cells of every row with at least three; numpy converts and scales them in bulk
+            cells = [row[:3] for row in csv.reader(io.StringIO(data), dialect) if len(row) >= 3]
+            table = np.array(cells, dtype=np.float64)
+            n = len(cells)
             if n == 0 or n > 4096:
                 raise ValueError("Entry count must be between 1 and 4096.")
-            max_val = max(max(values_r), max(values_g), max(values_b))
+            max_val = table.max()
             if max_val <= 1.0:
                 norm = 1.0
             elif max_val <= 255:
@@ -1905,10 +2337,7 @@ class ICCBuilderApp:
                 norm = 4095.0
             else:
                 norm = 65535.0
-            lut = []
-            for channel in (values_r, values_g, values_b):
-                normed = [v / norm for v in channel]
-                lut.append(normed)
+            lut = (table / norm).T.tolist()
             self.mhc2_lut_values = lut
             self.mhc2_entries.set(str(n))
             # rebuild tag with new LUT and current header/min/peak/matrix fields
@@ -2021,25 +2450,14 @@ class ICCBuilderApp:
 
         def convert_rows(rows, from_mode, to_mode):
             arr = parse_table(rows)
-            converted = np.zeros_like(arr)
             if from_mode == to_mode:
                 return
             if from_mode == "XYZ" and to_mode == "xyY":
-                for i in range(arr.shape[0]):
-                    X, Yv, Z = arr[i]
-                    if X == 0 and Yv == 0 and Z == 0:
-                        converted[i] = [0, 0, 0]
-                        continue
-                    x, y, Yc = XYZ_to_xyY_custom((X, Yv, Z))
-                    converted[i] = [x, y, Yc]
+                converted = XYZ_to_xyY_array(arr)
             elif from_mode == "xyY" and to_mode == "XYZ":
-                for i in range(arr.shape[0]):
-                    x, y, Yc = arr[i]
-                    try:
-                        X, Yv, Z = xyY_to_XYZ_custom((x, y, Yc))
-                    except Exception:
-                        X = Yv = Z = 0.0
-                    converted[i] = [float(X), float(Yv), float(Z)]
+                converted = xyY_to_XYZ_array(arr)
+            else:
+                converted = np.zeros_like(arr)
             fill_table(rows, converted)
 
         def toggle_mode():
@@ -2070,11 +2488,7 @@ class ICCBuilderApp:
             b_vec = np.asarray(rgb_primary_from_matrix(cs_key, "b"), dtype=float)
             target_xyz = np.vstack([w_xyz, r_vec, g_vec, b_vec])
             if mode_state["mode"] == "xyY":
-                xyY_vals = []
-                for row in target_xyz:
-                    x, y, Yc = XYZ_to_xyY_custom(tuple(row))
-                    xyY_vals.append([x, y, Yc])
-                target_xyz = np.asarray(xyY_vals, dtype=float)
+                target_xyz = XYZ_to_xyY_array(target_xyz)
             fill_table(target_table["rows"], target_xyz)
 
         def load_table_csv(rows):
@@ -2085,13 +2499,11 @@ class ICCBuilderApp:
             if not path:
                 return
             try:
-                import csv
-
                 with open(path, "r", encoding="utf-8-sig", newline="") as f:
                     data = f.read()
                 sample = data[:2048]
                 try:
-                    dialect = csv.Sniffer().sniff(sample, delimiters=",;\\t")
+                    dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
                 except Exception:
                     dialect = csv.excel
                 reader = csv.reader(io.StringIO(data), dialect)
@@ -2101,7 +2513,7 @@ class ICCBuilderApp:
                         continue
                     first3 = row[:3]
                     cleaned = [cell.strip() for cell in first3]
-                    if any(c == "" for c in cleaned):
+                    if len(cleaned) < 3 or any(c == "" for c in cleaned):
                         continue
                     try:
                         parsed = [float(c) for c in cleaned]
@@ -2112,10 +2524,7 @@ class ICCBuilderApp:
                         break
                 if len(vals) < 4:
                     raise ValueError("Need 4 rows (W,R,G,B).")
-                arr = np.zeros((4, 3), dtype=float)
-                for i in range(4):
-                    arr[i] = vals[i]
-                fill_table(rows, arr)
+                fill_table(rows, np.array(vals, dtype=float).reshape(4, 3))
                 restore_topmost()
             except Exception as exc:
                 messagebox.showerror("Load failed", f"Could not load CSV:\n{exc}")
@@ -2126,16 +2535,17 @@ class ICCBuilderApp:
             targ_arr = parse_table(target_table["rows"])
             # convert to XYZ for math
             if from_mode == "xyY":
-                meas_xyz = np.array([xyY_to_XYZ_custom(row) for row in meas_arr], dtype=float)
-                targ_xyz = np.array([xyY_to_XYZ_custom(row) for row in targ_arr], dtype=float)
+                meas_xyz = xyY_to_XYZ_array(meas_arr)
+                targ_xyz = xyY_to_XYZ_array(targ_arr)
             else:
                 meas_xyz = meas_arr
                 targ_xyz = targ_arr
             # normalize by respective white Y
             meas_white_Y = meas_xyz[0, 1] if meas_xyz[0, 1] != 0 else 1.0
             targ_white_Y = targ_xyz[0, 1] if targ_xyz[0, 1] != 0 else 1.0
-            meas_norm = meas_xyz / meas_white_Y
-            targ_norm = targ_xyz / targ_white_Y
+            # Presets already put white at Y=1, so there is often nothing to divide
+            meas_norm = meas_xyz if meas_white_Y == 1.0 else meas_xyz / meas_white_Y
+            targ_norm = targ_xyz if targ_white_Y == 1.0 else targ_xyz / targ_white_Y
             # least squares M (3x3) such that meas_norm @ M ≈ targ_norm
             try:
                 M, _, _, _ = np.linalg.lstsq(meas_norm, targ_norm, rcond=None)
@@ -2145,12 +2555,7 @@ class ICCBuilderApp:
             # build 3x4 matrix with last column zeros
             full_mat = np.zeros((3, 4), dtype=float)
             full_mat[:, :3] = M.T  # align rows as XYZ out per row
-            flat = full_mat.flatten().tolist()
-            idx = 0
-            for r in range(3):
-                for c in range(4):
-                    self.mhc2_matrix_vars[r][c].set(f"{flat[idx]:.6f}")
-                    idx += 1
+            self.set_mhc2_matrix(full_mat.ravel().tolist())
             # rebuild tag
             self.rebuild_mhc2_from_ui(
                 float(self.mhc2_min.get() or 0),
@@ -2201,26 +2606,16 @@ class ICCBuilderApp:
         self.trc_values = [fixed]
         self.trc_info.config(text=f"TRC: entry count=1 (Gamma={gamma_val:.1f})")
         if self.selected_tag and self.selected_tag.signature in {"rTRC", "gTRC", "bTRC"}:
-            new_hex = self.build_trc_bytes(self.trc_values).hex().upper()
-            self.update_shared_trc_curves(new_hex)
+            self.update_shared_trc_curves(self.build_trc_bytes(self.trc_values))
             if self.workspace_mode == "hex":
                 self.render_hex_view(self.selected_tag.data_bytes())
 
     def apply_trc_srgb(self):
-        # Generate 1024-entry sRGB curve per ICC recommendation
-        values = []
-        for i in range(1024):
-            x = i / 1023.0
-            if x <= 0.04045:
-                y = x / 12.92
-            else:
-                y = ((x + 0.055) / 1.055) ** 2.4
-            values.append(int(round(y * 65535)))
+        values = list(_SRGB_TRC_1024)
         self.trc_values = values
         self.trc_info.config(text=f"TRC: sRGB curve (count={len(values)})")
         if self.selected_tag and self.selected_tag.signature in {"rTRC", "gTRC", "bTRC"}:
-            new_hex = self.build_trc_bytes(self.trc_values).hex().upper()
-            self.update_shared_trc_curves(new_hex)
+            self.update_shared_trc_curves(self.build_trc_bytes(self.trc_values))
             if self.workspace_mode == "hex":
                 self.render_hex_view(self.selected_tag.data_bytes())
 
@@ -2255,8 +2650,7 @@ class ICCBuilderApp:
         self.trc_info.config(text=f"TRC: loaded curve (count={len(values)})")
         self.trc_status.config(text="Loaded successfully.")
         if self.selected_tag and self.selected_tag.signature in {"rTRC", "gTRC", "bTRC"}:
-            new_hex = self.build_trc_bytes(self.trc_values).hex().upper()
-            self.update_shared_trc_curves(new_hex)
+            self.update_shared_trc_curves(self.build_trc_bytes(self.trc_values))
             if self.workspace_mode == "hex":
                 self.render_hex_view(self.selected_tag.data_bytes())
 
@@ -2299,46 +2693,15 @@ class ICCBuilderApp:
         self.update_chromaticity_labels(X, Y_val, Z)
 
     def load_xyz_quick_options(self, sig: str):
-        if sig == "wtpt":
-            options = ["D50", "D55", "D60", "D65", "D75"]
-        else:
-            options = ["sRGB", "BT.709", "Adobe RGB", "Display P3", "DCI-P3", "BT.2020"]
-        self.xyz_quick["values"] = options
+        self.xyz_quick["values"] = _QUICK_FILL_ILLUMINANTS if sig == "wtpt" else _QUICK_FILL_SPACE_NAMES
         self.xyz_quick.set("")
 
     def apply_xyz_quick_fill(self):
         choice = self.xyz_quick.get()
         if not choice or not self.selected_tag:
             return
-        sig = self.selected_tag.signature
         try:
-            if choice in {"D50", "D55", "D60", "D65", "D75"}:
-                xy = ILLUMINANTS[choice]
-                XYZ = xy_to_XYZ_custom(xy)
-            else:
-                cs_key = {
-                    "sRGB": "sRGB",
-                    "Display P3": "P3-D65",
-                    "Adobe RGB": "Adobe RGB (1998)",
-                    "BT.2020": "ITU-R BT.2020",
-                    "BT.709": "ITU-R BT.709",
-                    "DCI-P3": "DCI-P3",
-                }[choice]
-                if sig == "rXYZ":
-                    XYZ = rgb_primary_from_matrix(cs_key, "r")
-                elif sig == "gXYZ":
-                    XYZ = rgb_primary_from_matrix(cs_key, "g")
-                elif sig == "bXYZ":
-                    XYZ = rgb_primary_from_matrix(cs_key, "b")
-                else:
-                    XYZ = rgb_whitepoint_xyz(cs_key)
-            X, Y_val, Z = [float(v) for v in XYZ]
-            # For wtpt, normalize to Y=1. For primaries, preserve luminance coefficients as-is.
-            if sig == "wtpt" and Y_val != 0:
-                factor = 1.0 / Y_val
-                X *= factor
-                Y_val *= factor
-                Z *= factor
+            X, Y_val, Z = xyz_quick_fill(self.selected_tag.signature, choice)
             self.xyz_x.set(f"{X:.6f}")
             self.xyz_y.set(f"{Y_val:.6f}")
             self.xyz_z.set(f"{Z:.6f}")
@@ -2353,21 +2716,25 @@ class ICCBuilderApp:
         sig = data[:4]
         if sig != b"mluc":
             raise ValueError("Tag is not mluc type")
-        _, _reserved, num_recs, rec_size_field = struct.unpack(">4sIII", data[:16])
+        _sig, num_recs, rec_size_field = _MLUC_HEADER_STRUCT.unpack_from(data)
         rec_size = rec_size_field if rec_size_field >= 12 else 12
+        # Records whose 12 fixed bytes lie inside the tag; a shorter table is reported once those are read
+        complete = min(num_recs, max(0, (len(data) - 28) // rec_size + 1))
+        if rec_size == 12:
+            raw_records = _MLUC_RECORD_STRUCT.iter_unpack(memoryview(data)[16 : 16 + complete * 12])
+        else:
+            raw_records = (_MLUC_RECORD_STRUCT.unpack_from(data, 16 + i * rec_size) for i in range(complete))
         records = []
-        for i in range(num_recs):
-            base = 16 + i * rec_size
-            if base + 12 > len(data):
-                raise ValueError("Record truncated")
-            lang = data[base : base + 2].decode("ascii", errors="replace")
-            country = data[base + 2 : base + 4].decode("ascii", errors="replace")
-            length, offset = struct.unpack(">II", data[base + 4 : base + 12])
+        for i, (lang_bytes, country_bytes, length, offset) in enumerate(raw_records):
+            lang = lang_bytes.decode("ascii", errors="replace")
+            country = country_bytes.decode("ascii", errors="replace")
             if offset + length > len(data):
                 raise ValueError(f"Record {i+1} string out of bounds")
             text_bytes = data[offset : offset + length]
             text = text_bytes.decode("utf-16be", errors="replace")
             records.append({"lang": lang, "country": country, "text": text, "length": length, "offset": offset})
+        if complete < num_recs:
+            raise ValueError("Record truncated")
         return records
 
     def compute_mluc_layout(self, records):
@@ -2380,82 +2747,127 @@ class ICCBuilderApp:
             length = len(text_bytes)
             layout.append({"length": length, "offset": offset})
             offset += length
-            pad = (4 - (offset % 4)) % 4
+            pad = -offset & 3
             offset += pad
         return layout
 
     def build_mluc_bytes(self, records):
-        layout = self.compute_mluc_layout(records)
-        header = struct.pack(">4sIII", b"mluc", 0, len(records), 12)
-        table = bytearray()
-        data = bytearray()
-        for rec, meta in zip(records, layout):
-            table.extend(rec["lang"].encode("ascii", errors="replace")[:2].ljust(2, b" "))
-            table.extend(rec["country"].encode("ascii", errors="replace")[:2].ljust(2, b" "))
-            table.extend(struct.pack(">II", meta["length"], meta["offset"]))
+        # Same layout as compute_mluc_layout, worked out while the pieces are collected so each
+        # text is encoded once; everything is joined in a single pass at the end
+        header = _MLUC_HEADER_STRUCT.pack(b"mluc", len(records), _MLUC_RECORD_STRUCT.size)
+        offset = 16 + len(records) * 12
+        table_parts = []
+        data_parts = []
+        for rec in records:
+            lang = rec["lang"].encode("ascii", errors="replace")[:2].ljust(2, b" ")
+            country = rec["country"].encode("ascii", errors="replace")[:2].ljust(2, b" ")
             text_bytes = rec["text"].encode("utf-16be")
-            data.extend(text_bytes)
-            pad = (4 - (len(data) % 4)) % 4
+            table_parts.append(_MLUC_RECORD_STRUCT.pack(lang, country, len(text_bytes), offset))
+            data_parts.append(text_bytes)
+            offset += len(text_bytes)
+            pad = -offset & 3
             if pad:
-                data.extend(b"\x00" * pad)
-        return header + table + data
+                data_parts.append(b"\x00" * pad)
+                offset += pad
+        return b"".join((header, *table_parts, *data_parts))
+
+    def _tag_row_values(self, idx: int, tag: TagEntry) -> Tuple[object, ...]:
+        size = tag.size()
+        return (idx, f"{tag.signature} - {tag.description}", f"{tag.offset} (0x{tag.offset:X})", f"{size} (0x{size:X})")
+
+    def _rebuild_tag_table(self, select_signature: str | None = None):
+        # Used when the whole tag list is replaced (new/load); edits go through the incremental refresh
+        if self._batching:
+            self._pending_ui.add("tags")
+            return
+        self.tag_table.delete(*self.tag_table.get_children())
+        self._tag_row_cache.clear()
+        self.refresh_tag_table(select_signature)
 
     def refresh_tag_table(self, select_signature: str | None = None):
-        self.compute_offsets()
-        self.tag_table.delete(*self.tag_table.get_children())
-        for idx, tag in enumerate(self.tags, start=0):
-            offset_disp = f"{tag.offset} (0x{tag.offset:X})"
-            size_disp = f"{tag.size()} (0x{tag.size():X})"
-            self.tag_table.insert(
-                "",
-                "end",
-                iid=tag.signature,
-                values=(idx, f"{tag.signature} - {tag.description}", offset_disp, size_disp),
-            )
-        if select_signature and select_signature in self.tag_table.get_children():
-            self.tag_table.selection_set(select_signature)
-            self.tag_table.see(select_signature)
-        self.update_profile_size_display()
+        # Sync the table with self.tags touching only rows that were added, removed, moved or
+        # whose values changed (offsets shift for every row after a resized tag).
+        total_size = self.compute_offsets()
+        table = self.tag_table
+        wanted = [t.signature for t in self.tags]
+        wanted_set = set(wanted)
+        # One children query up front; the resulting order is then tracked on the Python side
+        current = []
+        stale = []
+        for iid in table.get_children():
+            (current if iid in wanted_set else stale).append(iid)
+        if stale:
+            table.delete(*stale)
+            for iid in stale:
+                self._tag_row_cache.pop(iid, None)
+
+        for idx, tag in enumerate(self.tags):
+            sig = tag.signature
+            values = self._tag_row_values(idx, tag)
+            if sig not in self._tag_row_cache:
+                table.insert("", idx, iid=sig, values=values)
+                current.insert(idx, sig)
+            elif self._tag_row_cache[sig] != values:
+                table.item(sig, values=values)
+            self._tag_row_cache[sig] = values
+
+        if current != wanted:
+            for idx, sig in enumerate(wanted):
+                table.move(sig, "", idx)
+
+        if select_signature and select_signature in wanted_set:
+            table.selection_set(select_signature)
+            table.see(select_signature)
+        elif table.selection():
+            table.selection_remove(*table.selection())
+        self.update_profile_size_display(total_size)
         self.update_remove_state(select_signature)
 
-    def compute_offsets(self):
-        layout, _, _ = self._layout_tags()
-        for tag, off, _ in layout:
+    def compute_offsets(self) -> int:
+        # Offsets only depend on the ordered payloads; comparing the tuple is cheap because
+        # unchanged tags hand back the same cached bytes objects.
+        key = tuple(tag.data for tag in self.tags)
+        cache = self._offsets_cache
+        if cache is None or cache[0] != key:
+            offsets, total_size = compute_tag_offsets(self.tags)
+            cache = self._offsets_cache = (key, offsets, total_size)
+        for tag, off in zip(self.tags, cache[1]):
             tag.offset = off
+        return cache[2]
 
     def collect_header_hex(self) -> Dict[str, str]:
         hex_map: Dict[str, str] = {}
         for field in HEADER_FIELDS:
-            if field.get("hidden"):
-                hex_map[field["key"]] = self.header_values_hex[field["key"]]
+            if field.hidden:
+                hex_map[field.key] = self.header_values_hex[field.key]
                 continue
-            key = field["key"]
+            key = field.key
             var = self.header_vars.get(key)
 
-            if field["type"] == "flags" and self.header_mode == "human":
+            if field.type == "flags" and self.header_mode == "human":
                 emb, indep = (v.get() for v in var)  # type: ignore
                 hex_map[key] = encode_flags(emb, indep)  # type: ignore[arg-type]
                 continue
 
-            if field["type"] == "attributes" and self.header_mode == "human":
+            if field.type == "attributes" and self.header_mode == "human":
                 vals = [v.get() for v in var]  # type: ignore
                 hex_map[key] = encode_attributes(*vals)  # type: ignore[arg-type]
                 continue
 
-            if field["type"] == "illuminant" and self.header_mode == "human":
+            if field.type == "illuminant" and self.header_mode == "human":
                 x, y, z = (float(v.get()) for v in var)  # type: ignore
                 hex_map[key] = xyz_components_to_hex(x, y, z)
                 continue
 
             if isinstance(var, tuple):
                 # Should not happen for other types
-                hex_map[key] = self.header_values_hex.get(key, field["default_hex"])
+                hex_map[key] = self.header_values_hex.get(key, field.default_hex)
                 continue
 
             value = var.get()
-            if field["type"] in {"size", "datetime-fixed", "profile_id"} and self.header_mode == "human":
+            if field.type in {"size", "datetime-fixed", "profile_id"} and self.header_mode == "human":
                 # keep existing stored hex; these are auto-managed
-                hex_map[key] = self.header_values_hex.get(key, field["default_hex"])
+                hex_map[key] = self.header_values_hex.get(key, field.default_hex)
                 continue
 
             if self.header_mode == "human":
@@ -2466,24 +2878,27 @@ class ICCBuilderApp:
         return hex_map
 
     def build_header_bytes(self, size_override: int) -> bytes:
-        header_hex = dict(self.header_values_hex)
-        header_hex["size"] = int_to_hex(size_override, 4)
-        header_bytes = b""
-        for field in HEADER_FIELDS:
-            hex_value = header_hex[field["key"]]
-            if field["type"] == "hex":
-                cleaned = clean_hex(hex_value)
-            else:
-                cleaned = hex_value
-            field_bytes = bytes.fromhex(cleaned[: field["length"] * 2])
-            if len(field_bytes) < field["length"]:
-                field_bytes = field_bytes.ljust(field["length"], b"\x00")
-            header_bytes += field_bytes
-        if len(header_bytes) != 128:
-            raise ValueError(f"Header must be 128 bytes, got {len(header_bytes)}.")
-        return header_bytes
-
-    def build_profile_bytes(self) -> bytes:
+        if _HEADER_LENGTH != 128:
+            raise ValueError(f"Header must be 128 bytes, got {_HEADER_LENGTH}.")
+        header_hex = self.header_values_hex
+        # Fields are contiguous, so their hex texts are joined and decoded in one fromhex call
+        parts = []
+        for key, _start, length, is_hex in _HEADER_LAYOUT:
+            if key == "size":
+                parts.append(int_to_hex(size_override, 4))
+                continue
+            hex_value = header_hex[key]
+            if is_hex:
+                hex_value = clean_hex(hex_value)
+            part = hex_value[: length * 2]
+            if len(part) % 2 or not part.isalnum():
+                # Odd or spaced text: decode it alone (raising as before) so it cannot shift later fields
+                part = bytes.fromhex(part).hex()
+            # Short values are zero-padded on the right
+            parts.append(part.ljust(length * 2, "0"))
+        return bytes.fromhex("".join(parts))
+
+    def _assemble_profile(self) -> Tuple[Tuple[bytes, bytes, bytes], int, datetime]:
         layout, data_blocks, total_size = self._layout_tags()
 
         # Pull latest edits from UI
@@ -2491,23 +2906,22 @@ class ICCBuilderApp:
         # Auto-updated fields
         self.header_values_hex["size"] = int_to_hex(total_size, 4)
         now = datetime.now()
-        now_text = now.strftime("%Y-%m-%d %H:%M:%S")
-        self.header_values_hex["date_time"] = datetime_text_to_hex(now_text)
+        self.header_values_hex["date_time"] = _icc_datetime_hex(now)
         self.header_values_hex["profile_id"] = "00" * 16
 
         header = self.build_header_bytes(total_size)
 
-        tag_table = struct.pack(">I", len(self.tags))
-        for tag, offset, size in layout:
-            tag_table += struct.pack(">4sII", tag.signature.encode("ascii"), offset, size)
+        tag_table = bytearray(4 + len(layout) * 12)
+        _U32_STRUCT.pack_into(tag_table, 0, len(self.tags))
+        for i, (tag, offset, size) in enumerate(layout):
+            _TAG_RECORD_STRUCT.pack_into(tag_table, 4 + i * 12, tag.sig_bytes, offset, size)
+        tag_table = bytes(tag_table)
 
-        profile = bytearray(header + tag_table + data_blocks)
-        if len(profile) != total_size:
+        if len(header) + len(tag_table) + len(data_blocks) != total_size:
             raise ValueError("Profile size mismatch while building ICC.")
+        return (header, tag_table, data_blocks), total_size, now
 
-        # Compute profile ID (MD5) with profile_id set to zeroes
-        digest = hashlib.md5(profile).digest()
-        profile[84:100] = digest
+    def _apply_profile_id(self, digest: bytes, total_size: int, now: datetime):
         digest_hex = digest.hex().upper()
         self.header_values_hex["profile_id"] = digest_hex
 
@@ -2516,7 +2930,7 @@ class ICCBuilderApp:
             if isinstance(self.header_vars.get("size"), tk.Variable):
                 self.header_vars["size"].set(str(total_size))
             if isinstance(self.header_vars.get("date_time"), tk.Variable):
-                self.header_vars["date_time"].set(now_text)
+                self.header_vars["date_time"].set(now.strftime("%Y-%m-%d %H:%M:%S"))
             if isinstance(self.header_vars.get("profile_id"), tk.Variable):
                 self.header_vars["profile_id"].set(digest_hex)
         else:
@@ -2527,48 +2941,42 @@ class ICCBuilderApp:
             if isinstance(self.header_vars.get("profile_id"), tk.Variable):
                 self.header_vars["profile_id"].set(digest_hex)
 
-        return bytes(profile)
-
     def _layout_tags(self):
-        tag_table_size = 4 + len(self.tags) * 12
-        base_offset = 128 + tag_table_size
-        data_blocks = bytearray()
-        data_offsets: Dict[bytes, int] = {}
+        # Offsets (shared for identical payloads, 4-byte aligned) come from compute_offsets, so the
+        # data area can be allocated once and every unique payload copied straight into place.
+        total_size = self.compute_offsets()
+        base_offset = 128 + 4 + len(self.tags) * 12
+        data_blocks = bytearray(total_size - base_offset)
         layout: List[Tuple[TagEntry, int, int]] = []
-        offset_cursor = base_offset
+        written = set()
 
         for tag in self.tags:
-            data = tag.data_bytes()
-            existing_offset = data_offsets.get(data)
-            if existing_offset is not None:
-                layout.append((tag, existing_offset, len(data)))
+            data = tag.data
+            layout.append((tag, tag.offset, len(data)))
+            if tag.content_key in written:
                 continue
+            written.add(tag.content_key)
+            start = tag.offset - base_offset
+            data_blocks[start : start + len(data)] = data
 
-            tag_offset = offset_cursor
-            data_offsets[data] = tag_offset
-            layout.append((tag, tag_offset, len(data)))
-
-            data_blocks.extend(data)
-            offset_cursor += len(data)
-            pad = (4 - (offset_cursor % 4)) % 4
-            if pad:
-                data_blocks.extend(b"\x00" * pad)
-                offset_cursor += pad
-
-        total_size = offset_cursor
         return layout, bytes(data_blocks), total_size
 
-    def update_profile_size_display(self):
-        try:
-            _, _, total_size = self._layout_tags()
-        except Exception:
-            return
+    def update_profile_size_display(self, total_size: int | None = None):
+        if total_size is None:
+            try:
+                total_size = self.compute_offsets()
+            except Exception:
+                return
+        in_sync = self._header_render_sig is not None
         self.header_values_hex["size"] = int_to_hex(total_size, 4)
         if isinstance(self.header_vars.get("size"), tk.Variable):
             if self.header_mode == "human":
                 self.header_vars["size"].set(str(total_size))
             else:
                 self.header_vars["size"].set(self.header_values_hex["size"])
+        if in_sync:
+            # Widget and stored value were updated together, so the header still matches its render
+            self._header_render_sig = (self.header_mode, tuple(self.header_values_hex.items()))
 
     def update_remove_state(self, sig: str | None):
         if not hasattr(self, "remove_btn"):
@@ -2598,60 +3006,64 @@ class ICCBuilderApp:
             if len(data) < 132:
                 raise ValueError("File too small to be a valid ICC profile.")
             size_field = int.from_bytes(data[0:4], "big")
+            # Header fields are read through a view; only tag payloads are copied out of the file
+            view = memoryview(data)
             header_hex: Dict[str, str] = {}
             pos = 0
             for field in HEADER_FIELDS:
-                length = field["length"]
-                raw = data[pos : pos + length]
+                length = field.length
+                raw = view[pos : pos + length]
                 if len(raw) != length:
-                    raise ValueError(f"Header field {field['key']} truncated.")
-                header_hex[field["key"]] = raw.hex().upper()
+                    raise ValueError(f"Header field {field.key} truncated.")
+                header_hex[field.key] = raw.hex().upper()
                 pos += length
             if header_hex.get("acsp") != "61637370":
                 raise ValueError("Missing required 'acsp' signature.")
 
-            tag_count = struct.unpack_from(">I", data, 128)[0]
+            (tag_count,) = _U32_STRUCT.unpack_from(data, 128)
             tag_table_end = 132 + tag_count * 12
             if tag_table_end > len(data):
                 raise ValueError("Tag table exceeds file size.")
             tags: List[TagEntry] = []
+            # Tags that point at the same (offset, size) share one payload copy
+            chunks: Dict[Tuple[int, int], bytes] = {}
             for i in range(tag_count):
-                sig_bytes, offset, size = struct.unpack_from(">4sII", data, 132 + i * 12)
+                sig_bytes, offset, size = _TAG_RECORD_STRUCT.unpack_from(data, 132 + i * 12)
                 sig = sig_bytes.decode("ascii", errors="replace")
                 if offset + size > len(data):
                     raise ValueError(f"Tag {sig} out of bounds (offset {offset}, size {size}).")
                 if offset < tag_table_end:
                     raise ValueError(f"Tag {sig} overlaps header/tag table (offset {offset}).")
-                chunk = data[offset : offset + size]
+                chunk = chunks.get((offset, size))
+                if chunk is None:
+                    chunk = chunks[(offset, size)] = bytes(view[offset : offset + size])
                 if len(chunk) != size:
                     raise ValueError(f"Tag {sig} size mismatch (expected {size}, found {len(chunk)}).")
                 tags.append(
                     TagEntry(
                         sig,
                         KNOWN_TAG_LIBRARY.get(sig, "Custom tag"),
-                        chunk.hex().upper(),
+                        chunk,
                         offset=offset,
                     )
                 )
 
             header_hex["size"] = int_to_hex(len(data), 4)
-            self.header_values_hex = header_hex
-            self.header_mode = "human"
-            self.render_header_fields()
-            self.tags = tags
-            self.refresh_tag_table()
-            self.refresh_search_results()
-            self.hex_text.delete("1.0", tk.END)
-            self.tag_title.config(text="Select a tag to edit")
+            with self._batch_ui():
+                self.header_values_hex = header_hex
+                self.header_mode = "human"
+                self.render_header_fields()
+                self._set_tags(tags)
+                self._rebuild_tag_table()
+                self.refresh_search_results()
+                self._clear_tag_editor()
             messagebox.showinfo("Loaded", f"Loaded ICC profile:\n{path}")
         except Exception as exc:
             messagebox.showerror("Load failed", f"Could not load ICC profile:\n{exc}")
 
     def save_profile(self):
-        try:
-            data = self.build_profile_bytes()
-        except Exception as exc:
-            messagebox.showerror("Build failed", f"Could not build ICC profile:\n{exc}")
+        if self._save_future is not None:
+            messagebox.showinfo("Save in progress", "The previous profile is still being written.")
             return
         path = filedialog.asksaveasfilename(
             defaultextension=".icc",
@@ -2660,8 +3072,33 @@ class ICCBuilderApp:
         )
         if not path:
             return
-        with open(path, "wb") as f:
-            f.write(data)
+        # Assembling rewrites size/date_time/profile_id in header_values_hex, so only do it once saving is certain
+        try:
+            pieces, total_size, now = self._assemble_profile()
+        except Exception as exc:
+            messagebox.showerror("Build failed", f"Could not build ICC profile:\n{exc}")
+            return
+        if total_size < _BACKGROUND_SAVE_MIN_SIZE:
+            digest = write_profile(path, pieces)
+            self._apply_profile_id(digest, total_size, now)
+            messagebox.showinfo("Saved", f"Profile saved to:\n{path}")
+            return
+        # Large profiles are hashed and written on a worker thread; the Tk side polls for completion
+        self._save_future = _SAVE_EXECUTOR.submit(write_profile, path, pieces)
+        self.root.after(50, self._poll_save, path, total_size, now)
+
+    def _poll_save(self, path: str, total_size: int, now: datetime):
+        future = self._save_future
+        if not future.done():
+            self.root.after(50, self._poll_save, path, total_size, now)
+            return
+        self._save_future = None
+        try:
+            digest = future.result()
+        except Exception as exc:
+            messagebox.showerror("Save failed", f"Could not write ICC profile:\n{exc}")
+            return
+        self._apply_profile_id(digest, total_size, now)
         messagebox.showinfo("Saved", f"Profile saved to:\n{path}")
 
     def show_about(self):